@@ -9,38 +9,42 @@ async def main():
     async with NexusClient("http://localhost:15474") as client:
         print("=== Performance Monitoring ===\n")
 
-        # Get query statistics
+        # The three statistics endpoints are read-only and independent, so
+        # pipeline them. raise_on_error=False keeps a failure in one endpoint
+        # from hiding the results of the others.
+        async with client.pipeline() as p:
+            p.get_query_statistics().get_slow_queries().get_plan_cache_statistics()
+            stats, slow_queries, cache_stats = await p.execute(raise_on_error=False)
+
+        # Query statistics
         print("1. Getting query statistics...")
-        try:
-            stats = await client.get_query_statistics()
+        if isinstance(stats, Exception):
+            print(f"   Error: {stats}\n")
+        else:
             print(f"   Total queries: {stats.statistics.total_queries}")
             print(f"   Successful: {stats.statistics.successful_queries}")
             print(f"   Failed: {stats.statistics.failed_queries}")
             print(f"   Average time: {stats.statistics.average_execution_time_ms}ms\n")
-        except Exception as e:
-            print(f"   Error: {e}\n")
 
-        # Get slow queries
+        # Slow queries
         print("2. Getting slow queries...")
-        try:
-            slow_queries = await client.get_slow_queries()
+        if isinstance(slow_queries, Exception):
+            print(f"   Error: {slow_queries}\n")
+        else:
             print(f"   Found {slow_queries.count} slow queries")
             for query in slow_queries.queries[:5]:  # Show first 5
                 print(f"   - {query.query[:50]}... ({query.execution_time_ms}ms)\n")
-        except Exception as e:
-            print(f"   Error: {e}\n")
 
-        # Get plan cache statistics
+        # Plan cache statistics
         print("3. Getting plan cache statistics...")
-        try:
-            cache_stats = await client.get_plan_cache_statistics()
+        if isinstance(cache_stats, Exception):
+            print(f"   Error: {cache_stats}\n")
+        else:
             print(f"   Cached plans: {cache_stats.cached_plans}")
             print(f"   Hit rate: {cache_stats.hit_rate:.2%}")
             print(f"   Memory usage: {cache_stats.current_memory_bytes} bytes\n")
-        except Exception as e:
-            print(f"   Error: {e}\n")
 
-        # Clear plan cache
+        # Clear plan cache — a mutation, so it runs only after the reads
         print("4. Clearing plan cache...")
         try:
             result = await client.clear_plan_cache()
@@ -1,30 +1,46 @@
 """Query builder example for Nexus Python SDK."""
 
 import asyncio
+from typing import Optional
+
 from nexus_sdk import NexusClient, QueryBuilder
 
 
+def build_shape(
+    match: str,
+    where: str,
+    returns: str,
+    order: str,
+    limit: int,
+    with_: Optional[str] = None,
+) -> str:
+    """Build the query text for a given query shape.
+
+    The text only depends on the shape; parameter values are supplied per
+    execution.
+    """
+    builder = QueryBuilder().match_(match)
+    if with_ is not None:
+        builder.with_(with_)
+    return builder.where_(where).return_(returns).order_by(order).limit(limit).query()
+
+
 async def main():
     """Run query builder example."""
     async with NexusClient("http://localhost:15474") as client:
         # Build a query using QueryBuilder
         print("=== Using QueryBuilder ===\n")
 
-        # Example 1: Simple MATCH query
-        query1 = (
-            QueryBuilder()
-            .match_("(n:Person)")
-            .where_("n.age > $min_age")
-            .return_("n.name, n.age")
-            .order_by("n.age DESC")
-            .limit(10)
-            .param("min_age", 25)
-            .build()
-        )
-
+        # Example 1: Simple MATCH query, run for several parameter values.
+        # The shape is built once; only the parameters change, and
+        # execute_many sends all three runs together.
+        ages = (25, 30, 35)
+        query1 = build_shape("(n:Person)", "n.age > $min_age", "n.name, n.age", "n.age DESC", 10)
         print(f"Query 1:\n{query1}\n")
-        result1 = await client.execute_cypher(query1.query, query1.params)
-        print(f"Results: {len(result1.rows)} rows\n")
+        results1 = await client.execute_many([(query1, {"min_age": min_age}) for min_age in ages])
+        for min_age, result1 in zip(ages, results1):
+            print(f"Results (min_age={min_age}): {len(result1.rows)} rows")
+        print()
 
         # Example 2: CREATE with parameters
         query2 = (
@@ -41,20 +57,17 @@ async def main():
         print(f"Created: {len(result2.rows)} rows\n")
 
         # Example 3: Complex query with WITH
-        query3 = (
-            QueryBuilder()
-            .match_("(p:Person)-[:KNOWS]->(f:Person)")
-            .with_("p, count(f) AS friend_count")
-            .where_("friend_count > $min_friends")
-            .return_("p.name, friend_count")
-            .order_by("friend_count DESC")
-            .limit(5)
-            .param("min_friends", 2)
-            .build()
+        query3 = build_shape(
+            "(p:Person)-[:KNOWS]->(f:Person)",
+            "friend_count > $min_friends",
+            "p.name, friend_count",
+            "friend_count DESC",
+            5,
+            with_="p, count(f) AS friend_count",
         )
 
         print(f"Query 3:\n{query3}\n")
-        result3 = await client.execute_cypher(query3.query, query3.params)
+        result3 = await client.execute_cypher(query3, {"min_friends": 2})
         print(f"Results: {len(result3.rows)} rows\n")
 
 
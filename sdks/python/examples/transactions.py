@@ -14,19 +14,14 @@ async def main():
         print(f"Transaction active: {tx.is_active()}")
         print(f"Transaction status: {tx.status()}\n")
 
-        # Execute queries within transaction
+        # Execute queries within transaction. UNWIND creates every row in a
+        # single statement, so the round-trip count does not grow with N.
         print("=== Creating Nodes in Transaction ===")
-        result1 = await tx.execute(
-            "CREATE (n:Person {name: $name}) RETURN n",
-            {"name": "Alice"},
+        result = await tx.execute(
+            "UNWIND $rows AS row CREATE (n:Person {name: row.name}) RETURN n",
+            {"rows": [{"name": "Alice"}, {"name": "Bob"}]},
         )
-        print(f"Created node 1: {result1.rows}\n")
-
-        result2 = await tx.execute(
-            "CREATE (n:Person {name: $name}) RETURN n",
-            {"name": "Bob"},
-        )
-        print(f"Created node 2: {result2.rows}\n")
+        print(f"Created {len(result.rows)} nodes: {result.rows}\n")
 
         # Commit transaction
         print("=== Committing Transaction ===")
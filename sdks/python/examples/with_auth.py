@@ -1,30 +1,29 @@
 """Authentication examples for Nexus Python SDK."""
 
 import asyncio
+
+import httpx
 from nexus_sdk import NexusClient
 
 
 async def main():
     """Run authentication examples."""
-    # Using API key
-    print("=== Using API Key ===")
-    async with NexusClient("http://localhost:15474", api_key="your-api-key") as client:
-        healthy = await client.health_check()
-        print(f"Server is healthy: {healthy}")
-
-    # Using username/password
-    print("\n=== Using Username/Password ===")
-    async with NexusClient(
-        "http://localhost:15474", username="user", password="pass"
-    ) as client:
-        healthy = await client.health_check()
-        print(f"Server is healthy: {healthy}")
-
-    # Without authentication (if server allows)
-    print("\n=== Without Authentication ===")
-    async with NexusClient("http://localhost:15474") as client:
-        healthy = await client.health_check()
-        print(f"Server is healthy: {healthy}")
+    # Credentials are sent per request, so the three clients below can share
+    # one connection pool instead of each opening (and tearing down) its own.
+    async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as http_client:
+        examples = [
+            ("Using API Key", {"api_key": "your-api-key"}),
+            ("Using Username/Password", {"username": "user", "password": "pass"}),
+            # Without authentication (if server allows)
+            ("Without Authentication", {}),
+        ]
+        for title, auth in examples:
+            print(f"=== {title} ===")
+            async with NexusClient(
+                "http://localhost:15474", http_client=http_client, **auth
+            ) as client:
+                healthy = await client.health_check()
+                print(f"Server is healthy: {healthy}\n")
 
 
 if __name__ == "__main__":
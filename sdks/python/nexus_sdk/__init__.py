@@ -43,6 +43,7 @@ from nexus_sdk.models import (
     SwitchDatabaseRequest,
     SwitchDatabaseResponse,
 )
+from nexus_sdk.pipeline import Pipeline
 from nexus_sdk.query_builder import QueryBuilder
 from nexus_sdk.transaction import Transaction, TransactionStatus
 from nexus_sdk.transport import (
@@ -89,6 +90,7 @@ __all__ = [
     "QueryStatisticsResponse",
     "SlowQueriesResponse",
     "PlanCacheStatisticsResponse",
+    "Pipeline",
     "QueryBuilder",
     "Transaction",
     "TransactionStatus",
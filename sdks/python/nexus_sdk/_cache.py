@@ -0,0 +1,61 @@
+"""Small LRU cache with per-entry expiry, used for idempotent reads."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+__all__ = ["MISSING", "ReadCache"]
+
+# Returned by ``ReadCache.get`` on a miss, since ``None`` is a valid value.
+MISSING = object()
+
+
+class ReadCache:
+    """LRU cache whose entries also expire ``ttl`` seconds after insertion.
+
+    A ``maxsize`` of 0 disables the cache: ``get`` always misses and
+    ``put`` stores nothing.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        """Return the live value for ``key``, or ``default`` on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used.
+
+        ``ttl`` overrides the cache-wide lifetime for this entry.
+        """
+        if self.maxsize <= 0:
+            return
+        lifetime = self.ttl if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + lifetime, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        """Drop the entry for ``key`` if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
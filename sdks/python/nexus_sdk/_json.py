@@ -0,0 +1,53 @@
+"""JSON helpers shared by the HTTP code paths.
+
+Uses ``orjson`` when it is installed (``pip install hivehub-nexus-sdk[fast]``)
+and falls back to the standard library otherwise. ``loads`` accepts the raw
+response bytes directly, so callers never need a ``bytes -> str`` decode;
+``dumps`` returns compact UTF-8 bytes ready to send as a request body.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj: Any) -> bytes:
+        # Non-string keys are stringified, matching the stdlib behaviour.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+else:
+    loads = json.loads
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# Longest error body kept in an exception message; servers can answer
+# with whole HTML pages.
+_ERROR_BODY_LIMIT = 500
+
+
+def error_message(body: bytes) -> str:
+    """Extract a short error message from a response body.
+
+    Prefers the ``error`` / ``message`` field of a JSON object body and
+    otherwise returns the body itself, truncated to 500 bytes.
+    """
+    try:
+        parsed = loads(body)
+    except ValueError:
+        parsed = None
+    if isinstance(parsed, dict):
+        message = parsed.get("error") or parsed.get("message")
+        if isinstance(message, str) and message:
+            return message[:_ERROR_BODY_LIMIT]
+    return body[:_ERROR_BODY_LIMIT].decode("utf-8", "replace")
+
+
+__all__ = ["dumps", "error_message", "loads"]
@@ -4,8 +4,36 @@ from __future__ import annotations
 
 import asyncio
 import base64
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import functools
+import inspect
+import math
+import random
+import re
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NoReturn,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 import httpx
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depends on the environment
+    ijson = None
 
 if TYPE_CHECKING:
     from nexus_sdk.models import (
@@ -16,28 +44,26 @@ if TYPE_CHECKING:
         SlowQueriesResponse,
     )
     from nexus_sdk.transaction import Transaction
-from urllib.parse import urljoin
 
+from nexus_sdk._cache import MISSING, ReadCache
+from nexus_sdk._json import dumps, error_message, loads
 from nexus_sdk.error import (
     ApiError,
     ConfigurationError,
     HttpError,
     NetworkError,
     TimeoutError,
+    ValidationError,
 )
 from nexus_sdk.models import (
     QueryResult,
     DatabaseStats,
     Node,
-    CreateNodeRequest,
     CreateNodeResponse,
     GetNodeByExternalIdResponse,
-    UpdateNodeRequest,
     UpdateNodeResponse,
     DeleteNodeResponse,
-    CreateRelationshipRequest,
     CreateRelationshipResponse,
-    UpdateRelationshipRequest,
     UpdateRelationshipResponse,
     DeleteRelationshipResponse,
     LabelResponse,
@@ -46,22 +72,151 @@ from nexus_sdk.models import (
     # Database management models
     DatabaseInfo,
     ListDatabasesResponse,
-    CreateDatabaseRequest,
     CreateDatabaseResponse,
     DropDatabaseResponse,
-    SwitchDatabaseRequest,
     SwitchDatabaseResponse,
 )
+from nexus_sdk.pipeline import Pipeline
 from nexus_sdk.transport import (
     Transport,
     TransportCredentials,
     TransportMode,
     TransportRequest,
+    TransportResponse,
     build_transport,
     nx,
 )
 from nexus_sdk.transport.command_map import json_to_nexus, nexus_to_json
 
+# Pool sized for batch helpers that keep up to 32 requests in flight.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0,
+)
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+# Failures raised before any request bytes left the client.
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Cypher that may change data or session state; never served from, and
+# always clears, the query result cache.
+_WRITE_QUERY = re.compile(
+    r"\b(CREATE|MERGE|DELETE|DETACH|SET|REMOVE|DROP|CALL|LOAD|FOREACH|USE"
+    r"|BEGIN|COMMIT|ROLLBACK)\b",
+    re.IGNORECASE,
+)
+
+# Statements that open or end a transaction (see ``_in_transaction``).
+_TX_CONTROL = re.compile(r"\s*(BEGIN|COMMIT|ROLLBACK)\b", re.IGNORECASE)
+
+
+class _AsyncByteReader:
+    """Adapt an async byte iterator to the ``read()`` interface ijson wants."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs text.
+        if size == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+# Retry delays in seconds, doubling per attempt and capped at 3.2s.
+_BACKOFFS = (0.1, 0.2, 0.4, 0.8, 1.6, 3.2)
+
+
+async def _sleep_backoff(attempt: int) -> None:
+    """Sleep before retry ``attempt``, with jitter so concurrent callers
+    that failed together do not retry in lockstep."""
+    await asyncio.sleep(_BACKOFFS[min(attempt, 5)] + random.random() * 0.05)
+
+
+def _raise_api_error(response: httpx.Response) -> NoReturn:
+    """Raise ApiError for a non-success response, carrying its body."""
+    status = response.status_code
+    raise ApiError(error_message(response.content) or f"HTTP {status}", status)
+
+
+def _validate_batch(model: Any, items: List[Dict[str, Any]], what: str) -> List[Any]:
+    """Validate every batch item up front, reporting all bad items at once.
+
+    Raises:
+        ValidationError: Listing the index and cause of each invalid item
+    """
+    validated = []
+    errors = []
+    for index, item in enumerate(items):
+        try:
+            validated.append(model(**item))
+        except (TypeError, PydanticValidationError) as e:
+            errors.append(f"{what} {index}: {e}")
+    if errors:
+        raise ValidationError(f"Invalid batch input: {'; '.join(errors)}")
+    return validated
+
+
+def _query_cache_key(query: str, parameters: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Key for the query result cache, or None if the parameters can't be
+    encoded as JSON (e.g. ``bytes``), in which case the call is uncached."""
+    try:
+        return f"{query}\x00{dumps(parameters).decode()}"
+    except (TypeError, ValueError):
+        return None
+
+
+_T = TypeVar("_T")
+_M = TypeVar("_M", bound=BaseModel)
+
+
+def _cached_read(
+    key: Callable[..., str], metadata_ttl: Optional[float] = None
+) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Awaitable[_T]]]:
+    """Serve an idempotent read from the client's read cache.
+
+    ``key`` maps the method's arguments, passed by name, to the cache key.
+    Positional and keyword calls share entries. Reads given a
+    ``metadata_ttl`` use the metadata cache instead when it is enabled,
+    keeping entries for that many seconds. With both caches disabled (the
+    default) the method runs unchanged. A result is not stored if a write
+    went out while it was being fetched, since it may predate the write.
+    """
+
+    def decorator(method: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def wrapper(self: "NexusClient", *args: Any, **kwargs: Any) -> _T:
+            cache, ttl = self._read_cache, None
+            if metadata_ttl is not None and self._metadata_cache.maxsize:
+                cache, ttl = self._metadata_cache, metadata_ttl
+            if not cache.maxsize:
+                return await method(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            del arguments["self"]
+            cache_key = key(**arguments)
+            value = cache.get(cache_key)
+            if value is MISSING:
+                writes = self._writes
+                value = await method(*bound.args, **bound.kwargs)
+                if self._writes == writes:
+                    cache.put(cache_key, value, ttl)
+            return value  # type: ignore[no-any-return]
+
+        return wrapper
+
+    return decorator
+
 
 class NexusClient:
     """Nexus client for interacting with the Nexus graph database.
@@ -102,6 +257,14 @@ class NexusClient:
         transport: Optional[TransportMode] = None,
         rpc_port: Optional[int] = None,
         resp3_port: Optional[int] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        http2: bool = False,
+        read_cache_size: int = 0,
+        read_cache_ttl: float = 5.0,
+        enable_metadata_cache: bool = False,
+        validate_responses: bool = False,
+        query_cache_size: int = 0,
+        prewarm: bool = False,
     ):
         """Create a new Nexus client.
 
@@ -118,6 +281,42 @@ class NexusClient:
             transport: Explicit transport hint. The URL scheme wins if set.
             rpc_port: RPC port override when ``transport='nexus'`` (default 15475).
             resp3_port: RESP3 port override (default 15476).
+            http_client: Optional shared ``httpx.AsyncClient``. Lets several
+                clients reuse one connection pool; its own timeout and
+                headers apply, and ``close()`` leaves it open for the owner.
+            http2: Negotiate HTTP/2 for the REST endpoints so concurrent
+                requests multiplex over one connection. Requires the
+                ``http2`` extra (``pip install hivehub-nexus-sdk[http2]``).
+                Ignored when ``http_client`` is given.
+            read_cache_size: Number of idempotent read results (``get_node``,
+                ``list_labels``, ``list_rel_types``, ``get_stats``,
+                ``get_query_statistics``) to keep in memory (default: 0,
+                disabled). Hits return the same model object without a
+                round-trip. Any REST write through this client clears the
+                cache; other writes (e.g. Cypher) are seen once
+                ``read_cache_ttl`` expires.
+            read_cache_ttl: Seconds a cached read stays valid (default: 5.0).
+            enable_metadata_cache: Keep ``list_labels`` and ``list_rel_types``
+                results until a write through this client may change them,
+                and ``get_stats`` for 2 seconds (default: False). Any
+                ``execute_cypher`` call drops the cached metadata.
+            validate_responses: Run pydantic validation on Cypher results
+                (default: False). The server's replies are trusted, so
+                ``QueryResult`` is built without re-checking every row;
+                enable this to have malformed replies rejected.
+            query_cache_size: Number of read-only ``execute_cypher`` results
+                to keep, keyed on query text and parameters (default: 0,
+                disabled). Entries expire after ``read_cache_ttl``; any
+                write query, REST write or transaction boundary through
+                this client clears the cache, and reads inside a
+                transaction are not cached. Hits return the same
+                ``QueryResult`` object, so callers must not mutate it. Calls
+                whose parameters are not JSON-encodable (e.g. ``bytes``) are
+                not cached.
+                ``cache_stats()`` reports hits and misses.
+            prewarm: Call ``warm_up()`` when entering ``async with``, so
+                connections are open before the first request
+                (default: False).
 
         Raises:
             ConfigurationError: If the configuration is invalid.
@@ -135,25 +334,60 @@ class NexusClient:
                 rpc_port=rpc_port,
                 resp3_port=resp3_port,
                 timeout_s=timeout,
+                http_client=http_client,
             )
             self._transport: Transport = built.transport
             self._endpoint = built.endpoint
             self._mode = built.mode
 
             self.base_url = str(built.endpoint.as_http_url()).rstrip("/")
+            # Fixed REST endpoint URLs, built once instead of per request.
+            self._url_nodes = f"{self.base_url}/data/nodes"
+            self._url_rels = f"{self.base_url}/data/relationships"
+            self._url_labels = f"{self.base_url}/schema/labels"
+            self._url_rel_types = f"{self.base_url}/schema/rel-types"
+            self._url_databases = f"{self.base_url}/databases"
+            self._url_session_database = f"{self.base_url}/session/database"
             self.api_key = api_key
             self.username = username
             self.password = password
             self.timeout = timeout
             self.max_retries = max_retries
+            self.validate_responses = validate_responses
+            self.prewarm = prewarm
 
             # Keep a dedicated httpx client for the REST-specific endpoints
             # (``/data/nodes``, ``/schema/*``) that do not yet have RPC
             # equivalents. Core methods route through ``self._transport``.
-            self._client = httpx.AsyncClient(
+            # Credentials are fixed for the client's lifetime, so the auth
+            # headers are built once. An owned httpx client sends them as
+            # defaults; a shared one gets them per request instead.
+            self._auth_headers = self._get_auth_headers()
+            self._owns_client = http_client is None
+            self._request_headers = {} if self._owns_client else self._auth_headers
+            self._client = http_client or httpx.AsyncClient(
+                http2=http2,
                 timeout=httpx.Timeout(timeout),
-                headers={"User-Agent": "nexus-sdk/2.5.0"},
+                limits=_HTTP_LIMITS,
+                headers={"User-Agent": "nexus-sdk/2.5.0", **self._auth_headers},
+            )
+            self._read_cache = ReadCache(read_cache_size, read_cache_ttl)
+            self._query_cache = ReadCache(query_cache_size, read_cache_ttl)
+            self._query_cache_hits = 0
+            self._query_cache_misses = 0
+            # Inside a transaction reads may see its uncommitted writes, so
+            # they bypass the query cache until COMMIT or ROLLBACK.
+            self._in_transaction = False
+            # Schema lists and stats; entries carry their own TTL.
+            self._metadata_cache = ReadCache(
+                8 if enable_metadata_cache else 0, math.inf
             )
+            # REST writes sent so far; reads fetched across one aren't cached.
+            self._writes = 0
+            # GETs currently on the wire, keyed by URL (see ``_get``).
+            self._inflight: Dict[str, "asyncio.Future[httpx.Response]"] = {}
+            # Bulk endpoints the server answered 404/405 for; probed once.
+            self._bulk_unsupported: set = set()
         except (ValueError, TypeError) as e:
             raise ConfigurationError(f"Invalid configuration: {e}") from e
         except Exception as e:
@@ -161,6 +395,13 @@ class NexusClient:
 
     async def __aenter__(self):
         """Async context manager entry."""
+        if self.prewarm:
+            try:
+                await self.warm_up()
+            except BaseException:
+                # __aexit__ won't run, so release the connections here.
+                await self.close()
+                raise
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -170,7 +411,8 @@ class NexusClient:
     async def close(self):
         """Close the HTTP client and transport."""
         await self._transport.close()
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     @property
     def transport_mode(self) -> TransportMode:
@@ -193,15 +435,115 @@ class NexusClient:
             headers["Authorization"] = f"Basic {auth_b64}"
         return headers
 
+    def _evict(self, *keys: str) -> None:
+        """Drop cached reads that a write may have made stale."""
+        for key in keys:
+            self._read_cache.discard(key)
+            self._metadata_cache.discard(key)
+            self._inflight.pop(f"{self.base_url}{key}", None)
+
+    def _query_result(self, data: Dict[str, Any]) -> QueryResult:
+        """Build a QueryResult from a decoded server reply.
+
+        Validation walks every cell of ``rows``; unless
+        ``validate_responses`` is set the trusted reply is wrapped as is.
+        """
+        if self.validate_responses:
+            return QueryResult.model_validate(data)
+        return QueryResult.model_construct(**data)
+
+    @staticmethod
+    def _parse(response: httpx.Response, model: Type[_M]) -> _M:
+        """Decode a JSON response body straight into ``model``.
+
+        pydantic-core parses the bytes and validates in one pass, without
+        building an intermediate dict in Python.
+        """
+        return model.model_validate_json(response.content)
+
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """GET ``url`` with the client's retry policy.
+
+        Concurrent plain GETs of the same URL share one request: later
+        callers wait for the one already in flight instead of sending
+        their own.
+        """
+        if kwargs:
+            return await self._execute_with_retry("GET", url, **kwargs)
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._execute_with_retry("GET", url))
+            self._inflight[url] = task
+            task.add_done_callback(functools.partial(self._forget_inflight, url))
+        # Shielded so one caller being cancelled does not cancel the others.
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, url: str, task: "asyncio.Future[httpx.Response]") -> None:
+        """Drop ``task`` from the in-flight GETs unless a write already did."""
+        if self._inflight.get(url) is task:
+            del self._inflight[url]
+
+    async def _post(self, url: str, **kwargs) -> httpx.Response:
+        """POST to ``url`` with the client's retry policy."""
+        return await self._execute_with_retry("POST", url, **kwargs)
+
+    async def _request_and_parse(
+        self, method: str, url: str, model: Type[_M], **kwargs: Any
+    ) -> _M:
+        """Send a request and parse a 200 response into ``model``.
+
+        Raises:
+            ApiError: If the response status is not 200
+        """
+        if method == "GET":
+            response = await self._get(url, **kwargs)
+        else:
+            response = await self._execute_with_retry(method, url, **kwargs)
+        if response.status_code != 200:
+            _raise_api_error(response)
+        return self._parse(response, model)
+
     async def _execute_with_retry(
-        self, method: str, url: str, **kwargs
+        self, method: str, url: str, idempotent: Optional[bool] = None, **kwargs
     ) -> httpx.Response:
-        """Execute HTTP request with retry logic."""
-        headers = self._get_auth_headers()
-        if "headers" in kwargs:
-            headers.update(kwargs["headers"])
-        kwargs["headers"] = headers
+        """Execute HTTP request with retry logic.
 
+        Idempotent requests (GET, PUT, DELETE by default) are retried on
+        5xx answers and transport errors. Others, such as POST creates, are
+        only retried when the request provably never reached the server
+        (connection could not be opened), so a retry cannot create twice.
+        """
+        if idempotent is None:
+            idempotent = method in _IDEMPOTENT_METHODS
+        if "json" in kwargs:
+            # Encode once here so retries resend the same bytes.
+            kwargs["content"] = dumps(kwargs.pop("json"))
+            kwargs["headers"] = {**kwargs.get("headers", {}), **_JSON_CONTENT_TYPE}
+        if "headers" in kwargs:
+            kwargs["headers"] = {**self._request_headers, **kwargs["headers"]}
+        elif self._request_headers:
+            kwargs["headers"] = self._request_headers
+
+        if method == "GET":
+            return await self._request_with_retry(method, url, idempotent, kwargs)
+        # Anything but a read may change what cached reads, cached queries
+        # and GETs in flight return. In-flight GETs are detached both before
+        # and after the write, so no later read joins one that predates it.
+        self._writes += 1
+        self._read_cache.clear()
+        self._query_cache.clear()
+        self._inflight.clear()
+        try:
+            return await self._request_with_retry(method, url, idempotent, kwargs)
+        finally:
+            self._writes += 1
+            self._read_cache.clear()
+            self._inflight.clear()
+
+    async def _request_with_retry(
+        self, method: str, url: str, idempotent: bool, kwargs: Dict[str, Any]
+    ) -> httpx.Response:
+        """Send a prepared request, retrying as ``_execute_with_retry`` says."""
         last_error = None
         for attempt in range(self.max_retries + 1):
             try:
@@ -209,32 +551,21 @@ class NexusClient:
                 status = response.status_code
 
                 # Check if status is retryable (5xx errors)
-                if status >= 500 and attempt < self.max_retries:
-                    delay_ms = 100 * (1 << min(attempt, 5))  # Cap at 3.2s
-                    await asyncio.sleep(delay_ms / 1000.0)
+                if status >= 500 and idempotent and attempt < self.max_retries:
+                    await _sleep_backoff(attempt)
                     continue
 
                 return response
-            except httpx.TimeoutException as e:
-                last_error = e
-                if attempt < self.max_retries:
-                    delay_ms = 100 * (1 << min(attempt, 5))
-                    await asyncio.sleep(delay_ms / 1000.0)
-                    continue
-                raise TimeoutError("Request timeout") from e
-            except httpx.NetworkError as e:
-                last_error = e
-                if attempt < self.max_retries:
-                    delay_ms = 100 * (1 << min(attempt, 5))
-                    await asyncio.sleep(delay_ms / 1000.0)
-                    continue
-                raise NetworkError(f"Network error: {e}") from e
             except httpx.HTTPError as e:
                 last_error = e
-                if attempt < self.max_retries:
-                    delay_ms = 100 * (1 << min(attempt, 5))
-                    await asyncio.sleep(delay_ms / 1000.0)
+                retryable = idempotent or isinstance(e, _NOT_SENT_ERRORS)
+                if retryable and attempt < self.max_retries:
+                    await _sleep_backoff(attempt)
                     continue
+                if isinstance(e, httpx.TimeoutException):
+                    raise TimeoutError("Request timeout") from e
+                if isinstance(e, httpx.NetworkError):
+                    raise NetworkError(f"Network error: {e}") from e
                 raise HttpError(f"HTTP error: {e}", status_code=None) from e
 
         if last_error:
@@ -243,14 +574,47 @@ class NexusClient:
             ) from last_error
         raise NetworkError("Request failed after retries")
 
-    async def execute_cypher(
+    async def _send_cypher(
         self, query: str, parameters: Optional[Dict[str, Any]] = None
+    ) -> TransportResponse:
+        """Send a CYPHER request and return the raw transport response."""
+        args = [nx.Str(query)]
+        if parameters:
+            args.append(json_to_nexus(parameters))
+        try:
+            return await self._transport.execute(
+                TransportRequest(command="CYPHER", args=args)
+            )
+        except RuntimeError as e:
+            raise ApiError(str(e), 0) from e
+
+    async def _execute_control(self, statement: str) -> None:
+        """Run a transaction control statement, discarding its empty result.
+
+        Skips decoding the reply into a QueryResult, which callers of
+        BEGIN / COMMIT / ROLLBACK never look at. Cached query results are
+        dropped, since the transaction's writes now count or are undone.
+        """
+        # Stays set if the statement fails, as the server's state is unknown.
+        self._in_transaction = True
+        self._query_cache.clear()
+        await self._send_cypher(statement)
+        self._in_transaction = statement.startswith("BEGIN")
+
+    async def execute_cypher(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        cache: bool = True,
     ) -> QueryResult:
         """Execute a Cypher query via the active transport.
 
         Args:
             query: Cypher query string.
             parameters: Optional query parameters.
+            cache: Use the query result cache for this call when it is
+                enabled (``query_cache_size``); pass False to always go to
+                the server.
 
         Returns:
             QueryResult containing columns, rows, and execution metadata.
@@ -258,22 +622,147 @@ class NexusClient:
         Raises:
             ApiError: If the server returns an error.
         """
-        args = [nx.Str(query)]
-        if parameters:
-            args.append(json_to_nexus(parameters))
+        cache_key = None
+        tx_control = None
+        if self._query_cache.maxsize > 0:
+            if _WRITE_QUERY.search(query):
+                self._query_cache.clear()
+                tx_control = _TX_CONTROL.match(query)
+                if tx_control:
+                    self._in_transaction = True
+            elif cache and not self._in_transaction:
+                cache_key = _query_cache_key(query, parameters)
+            if cache_key is not None:
+                cached = self._query_cache.get(cache_key)
+                if cached is not MISSING:
+                    self._query_cache_hits += 1
+                    return cached
+                self._query_cache_misses += 1
         try:
-            resp = await self._transport.execute(
-                TransportRequest(command="CYPHER", args=args)
-            )
-        except RuntimeError as e:
-            raise ApiError(str(e), 0) from e
+            resp = await self._send_cypher(query, parameters)
+        finally:
+            # Any query may have changed the schema; metadata is refetched.
+            self._metadata_cache.clear()
+        if tx_control:
+            self._in_transaction = tx_control.group(1).upper() == "BEGIN"
         data = nexus_to_json(resp.value)
         if not isinstance(data, dict):
             raise ApiError(
                 f"CYPHER: expected object response, got {type(data).__name__}", 0
             )
-        return QueryResult(**data)
+        result = self._query_result(data)
+        if cache_key is not None and not result.error:
+            self._query_cache.put(cache_key, result)
+        return result
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return hit/miss counts and the size of the query result cache."""
+        return {
+            "hits": self._query_cache_hits,
+            "misses": self._query_cache_misses,
+            "size": len(self._query_cache),
+        }
+
+    async def execute_cypher_stream(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        as_dicts: bool = False,
+    ) -> AsyncIterator[Union[List[Any], Dict[str, Any]]]:
+        """Execute a Cypher query and yield its rows one at a time.
+
+        Over HTTP with ``ijson`` installed (``pip install
+        hivehub-nexus-sdk[stream]``) rows are parsed incrementally from the
+        response body, so only one row is held in memory at a time. Other
+        transports return the whole result in one frame; there the rows of
+        the buffered result are yielded.
+
+        Args:
+            query: Cypher query string.
+            parameters: Optional query parameters.
+            as_dicts: Yield each row as a ``{column: value}`` dict instead
+                of a list.
+
+        Yields:
+            One row (list of column values, or a dict with ``as_dicts``)
+            per result record.
+
+        Raises:
+            ApiError: If the server returns an error.
+        """
+        if ijson is None or self._mode not in (TransportMode.HTTP, TransportMode.HTTPS):
+            result = await self.execute_cypher(query, parameters)
+            if result.error:
+                raise ApiError(result.error, 0)
+            columns = result.columns
+            for row in result.rows:
+                yield dict(zip(columns, row)) if as_dicts else row
+            return
+
+        # Same invalidation as execute_cypher, which this path bypasses.
+        if _WRITE_QUERY.search(query):
+            self._query_cache.clear()
+        headers = {**self._request_headers, **_JSON_CONTENT_TYPE}
+        body = dumps({"query": query, "parameters": parameters})
+        try:
+            async with self._client.stream(
+                "POST", f"{self.base_url}/cypher", content=body, headers=headers
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    _raise_api_error(response)
+                reader = _AsyncByteReader(response.aiter_bytes())
+                # The server writes "columns" before "rows", so the names are
+                # known by the time the first row has been assembled. Query
+                # errors arrive in a 200 reply's "error" field after the rows.
+                columns = []
+                builder = None
+                error = None
+                async for prefix, event, value in ijson.parse(reader, use_float=True):
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == "rows.item" and event in ("end_array", "end_map"):
+                            row = builder.value
+                            yield dict(zip(columns, row)) if as_dicts else row
+                            builder = None
+                    elif prefix == "rows.item" and event in ("start_array", "start_map"):
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    elif prefix == "columns.item":
+                        columns.append(value)
+                    elif prefix == "error" and value is not None:
+                        error = value
+                if error:
+                    raise ApiError(str(error), 0)
+        finally:
+            self._metadata_cache.clear()
+
+    async def execute_many(
+        self, queries: Iterable[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[QueryResult]:
+        """Execute several independent Cypher queries together.
+
+        The queries are sent concurrently — back-to-back on the RPC socket or
+        over the HTTP connection pool — so the batch costs roughly one
+        round-trip instead of one per query. They must not depend on each
+        other's effects; use a transaction for ordered statements.
+
+        Args:
+            queries: ``(query, parameters)`` pairs.
+
+        Returns:
+            One QueryResult per query, in input order.
+
+        Raises:
+            ApiError: If the server returns an error for any query.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.execute_cypher(query, params) for query, params in queries)
+            )
+        )
 
+    @_cached_read(lambda: "STATS", metadata_ttl=2.0)
     async def get_stats(self) -> DatabaseStats:
         """Get database statistics via the active transport."""
         try:
@@ -298,16 +787,84 @@ class NexusClient:
                 },
                 "storage": data.get("storage", {}),
             }
-        return DatabaseStats(**data)
+        return DatabaseStats.model_validate(data)
+
+    async def health_check(self, timeout: float = 2.0) -> bool:
+        """Check server health via the active transport.
+
+        Makes a single attempt and fails fast: no retries, and an
+        unresponsive server counts as unhealthy after ``timeout`` seconds.
+
+        Args:
+            timeout: Seconds to wait for the answer (default: 2.0).
 
-    async def health_check(self) -> bool:
-        """Check server health via the active transport."""
+        Returns:
+            True if the server answered, False otherwise
+        """
         try:
-            await self._transport.execute(TransportRequest(command="HEALTH"))
+            await asyncio.wait_for(
+                self._transport.execute(TransportRequest(command="HEALTH")),
+                timeout,
+            )
             return True
         except Exception:
             return False
 
+    async def warm_up(self, connections: int = 4, timeout: float = 2.0) -> None:
+        """Open connections ahead of the first real request.
+
+        Sends a HEALTH request through the active transport (connecting the
+        RPC socket or an HTTP connection) and ``connections`` concurrent
+        health requests on the REST pool, which then keeps them alive. The
+        REST part is best effort, so an unreachable REST port on an
+        RPC-only deployment does not fail the warm-up. Like
+        ``health_check``, every request gives up after ``timeout`` seconds
+        rather than the client's full request timeout.
+
+        Args:
+            connections: REST connections to open (default: 4).
+            timeout: Seconds to wait for each warm-up request (default: 2.0).
+
+        Raises:
+            Exception: Whatever the transport raised if the server could
+                not be reached, or ``asyncio.TimeoutError``.
+        """
+        url = f"{self.base_url}/health"
+        results = await asyncio.gather(
+            asyncio.wait_for(
+                self._transport.execute(TransportRequest(command="HEALTH")), timeout
+            ),
+            *(
+                self._client.get(url, headers=self._request_headers, timeout=timeout)
+                for _ in range(connections)
+            ),
+            return_exceptions=True,
+        )
+        if isinstance(results[0], BaseException):
+            raise results[0]
+
+    async def wait_for_healthy(
+        self, timeout: float = 30.0, interval: float = 0.5
+    ) -> bool:
+        """Poll :meth:`health_check` until the server is healthy.
+
+        Args:
+            timeout: Total seconds to keep polling (default: 30.0).
+            interval: Seconds between attempts (default: 0.5).
+
+        Returns:
+            True once the server is healthy, False if ``timeout`` elapses
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            remaining = deadline - loop.time()
+            if await self.health_check(timeout=max(min(remaining, 2.0), 0.001)):
+                return True
+            if loop.time() + interval >= deadline:
+                return False
+            await asyncio.sleep(interval)
+
     async def create_node(
         self,
         labels: List[str],
@@ -333,26 +890,19 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        url = urljoin(self.base_url, "/data/nodes")
-        payload = CreateNodeRequest(
-            labels=labels,
-            properties=properties,
-            external_id=external_id,
-            conflict_policy=conflict_policy,
-        ).model_dump()
+        url = self._url_nodes
+        payload: Dict[str, Any] = {"labels": labels, "properties": properties or {}}
+        if external_id is not None:
+            payload["external_id"] = external_id
+        if conflict_policy is not None:
+            payload["conflict_policy"] = conflict_policy
 
-        response = await self._execute_with_retry("POST", url, json=payload)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return CreateNodeResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        try:
+            return await self._request_and_parse(
+                "POST", url, CreateNodeResponse, json=payload
+            )
+        finally:
+            self._evict("/schema/labels", "STATS")
 
     async def create_node_with_external_id(
         self,
@@ -407,20 +957,10 @@ class NexusClient:
         from urllib.parse import urlencode
 
         qs = urlencode({"external_id": external_id})
-        url = urljoin(self.base_url, f"/data/nodes/by-external-id?{qs}")
-        response = await self._execute_with_retry("GET", url)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return GetNodeByExternalIdResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        url = f"{self._url_nodes}/by-external-id?{qs}"
+        return await self._request_and_parse("GET", url, GetNodeByExternalIdResponse)
 
+    @_cached_read(lambda node_id: f"/data/nodes/{node_id}")
     async def get_node(self, node_id: int) -> Optional[Node]:
         """Get a node by ID.
 
@@ -433,23 +973,18 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        url = urljoin(self.base_url, f"/data/nodes/{node_id}")
-        response = await self._execute_with_retry("GET", url)
+        url = f"{self._url_nodes}/{node_id}"
+        response = await self._get(url)
         status = response.status_code
 
         if status == 200:
-            data = response.json()
+            data = loads(response.content)
             if "node" in data and data["node"]:
-                return Node(**data["node"])
+                return Node.model_validate(data["node"])
             return None
-        elif status == 404:
+        if status == 404:
             return None
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        _raise_api_error(response)
 
     async def update_node(
         self,
@@ -470,23 +1005,17 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        url = urljoin(self.base_url, f"/data/nodes/{node_id}")
-        payload = UpdateNodeRequest(
-            node_id=node_id, labels=labels, properties=properties
-        ).model_dump(exclude_none=True)
+        url = f"{self._url_nodes}/{node_id}"
+        payload: Dict[str, Any] = {"node_id": node_id}
+        if labels is not None:
+            payload["labels"] = labels
+        if properties is not None:
+            payload["properties"] = properties
 
-        response = await self._execute_with_retry("PUT", url, json=payload)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return UpdateNodeResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        try:
+            return await self._request_and_parse("PUT", url, UpdateNodeResponse, json=payload)
+        finally:
+            self._evict(f"/data/nodes/{node_id}", "/schema/labels", "STATS")
 
     async def delete_node(self, node_id: int) -> DeleteNodeResponse:
         """Delete a node.
@@ -500,19 +1029,11 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        url = urljoin(self.base_url, f"/data/nodes/{node_id}")
-        response = await self._execute_with_retry("DELETE", url)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return DeleteNodeResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        url = f"{self._url_nodes}/{node_id}"
+        try:
+            return await self._request_and_parse("DELETE", url, DeleteNodeResponse)
+        finally:
+            self._evict(f"/data/nodes/{node_id}", "/schema/labels", "STATS")
 
     async def create_relationship(
         self,
@@ -535,26 +1056,20 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        url = urljoin(self.base_url, "/data/relationships")
-        payload = CreateRelationshipRequest(
-            source_id=source_id,
-            target_id=target_id,
-            rel_type=rel_type,
-            properties=properties or {},
-        ).model_dump()
-
-        response = await self._execute_with_retry("POST", url, json=payload)
-        status = response.status_code
+        url = self._url_rels
+        payload = {
+            "source_id": source_id,
+            "target_id": target_id,
+            "rel_type": rel_type,
+            "properties": properties or {},
+        }
 
-        if status == 200:
-            data = response.json()
-            return CreateRelationshipResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        try:
+            return await self._request_and_parse(
+                "POST", url, CreateRelationshipResponse, json=payload
+            )
+        finally:
+            self._evict("/schema/rel-types", "STATS")
 
     async def update_relationship(
         self, relationship_id: int, properties: Dict[str, Any]
@@ -571,23 +1086,10 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        url = urljoin(self.base_url, f"/data/relationships/{relationship_id}")
-        payload = UpdateRelationshipRequest(
-            relationship_id=relationship_id, properties=properties
-        ).model_dump()
+        url = f"{self._url_rels}/{relationship_id}"
+        payload = {"relationship_id": relationship_id, "properties": properties}
 
-        response = await self._execute_with_retry("PUT", url, json=payload)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return UpdateRelationshipResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        return await self._request_and_parse("PUT", url, UpdateRelationshipResponse, json=payload)
 
     async def delete_relationship(
         self, relationship_id: int
@@ -603,19 +1105,13 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        url = urljoin(self.base_url, f"/data/relationships/{relationship_id}")
-        response = await self._execute_with_retry("DELETE", url)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return DeleteRelationshipResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        url = f"{self._url_rels}/{relationship_id}"
+        try:
+            return await self._request_and_parse(
+                "DELETE", url, DeleteRelationshipResponse
+            )
+        finally:
+            self._evict("STATS")
 
     async def create_label(self, name: str) -> LabelResponse:
         """Create a new label.
@@ -629,22 +1125,15 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        url = urljoin(self.base_url, "/schema/labels")
+        url = self._url_labels
         payload = {"name": name}
 
-        response = await self._execute_with_retry("POST", url, json=payload)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return LabelResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        try:
+            return await self._request_and_parse("POST", url, LabelResponse, json=payload)
+        finally:
+            self._evict("/schema/labels")
 
+    @_cached_read(lambda: "/schema/labels", metadata_ttl=math.inf)
     async def list_labels(self) -> LabelResponse:
         """List all labels.
 
@@ -654,12 +1143,12 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        url = urljoin(self.base_url, "/schema/labels")
-        response = await self._execute_with_retry("GET", url)
+        url = self._url_labels
+        response = await self._get(url)
         status = response.status_code
 
         if status == 200:
-            data = response.json()
+            data = loads(response.content)
             # Convert list of tuples to list of strings
             if "labels" in data and isinstance(data["labels"], list):
                 labels = [
@@ -667,13 +1156,8 @@ class NexusClient:
                     for label in data["labels"]
                 ]
                 data["labels"] = labels
-            return LabelResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+            return LabelResponse.model_validate(data)
+        _raise_api_error(response)
 
     async def create_rel_type(self, name: str) -> RelTypeResponse:
         """Create a new relationship type.
@@ -687,22 +1171,15 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        url = urljoin(self.base_url, "/schema/rel-types")
+        url = self._url_rel_types
         payload = {"name": name}
 
-        response = await self._execute_with_retry("POST", url, json=payload)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return RelTypeResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        try:
+            return await self._request_and_parse("POST", url, RelTypeResponse, json=payload)
+        finally:
+            self._evict("/schema/rel-types")
 
+    @_cached_read(lambda: "/schema/rel-types", metadata_ttl=math.inf)
     async def list_rel_types(self) -> RelTypeResponse:
         """List all relationship types.
 
@@ -712,29 +1189,29 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        url = urljoin(self.base_url, "/schema/rel-types")
-        response = await self._execute_with_retry("GET", url)
+        url = self._url_rel_types
+        response = await self._get(url)
         status = response.status_code
 
         if status == 200:
-            data = response.json()
+            data = loads(response.content)
             # Convert list of tuples to list of strings
             if "types" in data and isinstance(data["types"], list):
                 types = [
                     t[0] if isinstance(t, (list, tuple)) else t for t in data["types"]
                 ]
                 data["types"] = types
-            return RelTypeResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+            return RelTypeResponse.model_validate(data)
+        _raise_api_error(response)
 
-    async def begin_transaction(self) -> "Transaction":
+    async def begin_transaction(self, deferred: bool = False) -> "Transaction":
         """Begin a new transaction.
 
+        Args:
+            deferred: Hold back ``BEGIN`` and statements added with
+                ``Transaction.queue`` until commit, then send them in as few
+                round-trips as possible (see ``Transaction``).
+
         Returns:
             Transaction object for managing the transaction
 
@@ -743,7 +1220,7 @@ class NexusClient:
         """
         from nexus_sdk.transaction import Transaction
 
-        tx = Transaction(self)
+        tx = Transaction(self, deferred=deferred)
         await tx.begin()
         return tx
 
@@ -756,9 +1233,11 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        await self.execute_cypher("BEGIN TRANSACTION", None)
-        return TransactionResponse(
-            transaction_id=f"tx_{asyncio.get_event_loop().time()}",
+        from nexus_sdk.transaction import _TX_COUNTER
+
+        await self._execute_control("BEGIN TRANSACTION")
+        return TransactionResponse.model_construct(
+            transaction_id=f"tx_{next(_TX_COUNTER)}",
             success=True,
         )
 
@@ -771,8 +1250,8 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        await self.execute_cypher("COMMIT TRANSACTION", None)
-        return TransactionResponse(success=True)
+        await self._execute_control("COMMIT TRANSACTION")
+        return TransactionResponse.model_construct(success=True)
 
     async def rollback_transaction(self) -> TransactionResponse:
         """Rollback the current transaction.
@@ -783,63 +1262,200 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        await self.execute_cypher("ROLLBACK TRANSACTION", None)
-        return TransactionResponse(success=True)
+        await self._execute_control("ROLLBACK TRANSACTION")
+        return TransactionResponse.model_construct(success=True)
+
+    async def execute_in_tx(
+        self,
+        statements: Sequence[Union[str, Tuple[str, Optional[Dict[str, Any]]]]],
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> QueryResult:
+        """Run statements in one transaction, in as few round-trips as possible.
+
+        The statements are sent together to ``/cypher/tx`` when the server
+        provides it. Otherwise they run as ``BEGIN``, each statement, then
+        ``COMMIT``, rolling back if a statement fails or its result carries
+        an error.
+
+        Args:
+            statements: Cypher statements, executed in order. An item may
+                also be a ``(query, params)`` pair with its own parameters.
+            parameters: Optional parameters for the plain-string statements
+
+        Returns:
+            QueryResult of the last statement
+
+        Raises:
+            ValidationError: If ``statements`` is empty
+            ApiError: If the server returns an error or a statement fails
+        """
+        if not statements:
+            raise ValidationError("execute_in_tx requires at least one statement")
+
+        pairs = [
+            (item, parameters) if isinstance(item, str) else item
+            for item in statements
+        ]
+        data = await self._post_bulk(
+            "/cypher/tx",
+            {
+                "statements": [
+                    {"query": query, "parameters": params} for query, params in pairs
+                ]
+            },
+        )
+        if data is not None:
+            results = data.get("results") or [{}]
+            for item in results:
+                if item.get("error"):
+                    raise ApiError(item["error"], 0)
+            return self._query_result(results[-1])
+
+        await self._execute_control("BEGIN TRANSACTION")
+        try:
+            for query, params in pairs:
+                result = await self.execute_cypher(query, params, cache=False)
+                # The server reports Cypher errors in the body of a 200 reply.
+                if result.error:
+                    raise ApiError(result.error, 0)
+        except BaseException:
+            await self._execute_control("ROLLBACK TRANSACTION")
+            raise
+        await self._execute_control("COMMIT TRANSACTION")
+        return result
+
+    async def _post_bulk(
+        self, path: str, payload: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """POST a bulk payload, or return None if the server lacks the route.
+
+        A 404/405 answer is remembered so the probe happens once per client.
+        So is a REST port that refuses connections while another transport
+        is active, as on an RPC-only deployment.
+        """
+        if path in self._bulk_unsupported:
+            return None
+
+        url = self.base_url + path
+        try:
+            response = await self._post(url, json=payload)
+        except (NetworkError, TimeoutError) as e:
+            # Falling back is only safe if the request provably never left.
+            sent = not isinstance(e.__cause__, _NOT_SENT_ERRORS)
+            if sent or self._mode in (TransportMode.HTTP, TransportMode.HTTPS):
+                raise
+            self._bulk_unsupported.add(path)
+            return None
+        finally:
+            self._evict("/schema/labels", "/schema/rel-types", "STATS")
+        status = response.status_code
+
+        if status == 200:
+            return loads(response.content)
+        if status in (404, 405):
+            self._bulk_unsupported.add(path)
+            return None
+        _raise_api_error(response)
+
+    def pipeline(self) -> Pipeline:
+        """Start a pipeline of independent calls sent together.
+
+        Returns:
+            Pipeline on which client calls are queued and then executed
+            concurrently with :meth:`Pipeline.execute`
+        """
+        return Pipeline(self)
 
     async def batch_create_nodes(
-        self, nodes: List[Dict[str, Any]]
+        self, nodes: List[Dict[str, Any]], max_concurrency: int = 32
     ) -> "BatchCreateNodesResponse":
         """Batch create multiple nodes.
 
+        Nodes are sent in one request to ``/data/nodes/batch`` when the
+        server provides it. Otherwise they are created concurrently, at most
+        ``max_concurrency`` requests in flight at a time. Returned IDs keep
+        the order of ``nodes``.
+
         Args:
             nodes: List of node definitions, each with 'labels' and 'properties'
+            max_concurrency: Maximum number of concurrent create requests
 
         Returns:
             BatchCreateNodesResponse containing list of created node IDs
 
         Raises:
+            ValidationError: If any input item is invalid (nothing is sent)
+                or any create fails
             ApiError: If the API returns an error
         """
         from nexus_sdk.models import BatchNode, BatchCreateNodesResponse
 
-        # For now, create nodes sequentially
-        # TODO: Implement proper batch endpoint if available
+        batch_nodes = _validate_batch(BatchNode, nodes, "node")
+        data = await self._post_bulk(
+            "/data/nodes/batch",
+            {"nodes": [node.model_dump() for node in batch_nodes]},
+        )
+        if data is not None:
+            node_ids = data.get("node_ids", [])
+            return BatchCreateNodesResponse(
+                node_ids=node_ids,
+                message=data.get(
+                    "message", f"Successfully created {len(node_ids)} nodes"
+                ),
+            )
+
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _one(batch_node: BatchNode) -> CreateNodeResponse:
+            async with sem:
+                return await self.create_node(batch_node.labels, batch_node.properties)
+
+        results = await asyncio.gather(
+            *(_one(n) for n in batch_nodes), return_exceptions=True
+        )
+
         node_ids = []
         errors = []
-
-        for node_data in nodes:
-            try:
-                batch_node = BatchNode(**node_data)
-                response = await self.create_node(
-                    batch_node.labels, batch_node.properties
-                )
-                if response.node_id > 0:
-                    node_ids.append(response.node_id)
-            except Exception as e:
-                errors.append(f"Failed to create node: {e}")
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                errors.append(f"Failed to create node {index}: {result}")
+            elif result.error:
+                # The server reports create failures as 200 with node_id 0.
+                errors.append(f"Failed to create node {index}: {result.error}")
+            else:
+                node_ids.append(result.node_id)
 
         if errors:
-            from nexus_sdk.error import ValidationError
-
             raise ValidationError(f"Some nodes failed to create: {', '.join(errors)}")
 
-        return BatchCreateNodesResponse(
+        # IDs come from already-validated responses; skip re-validation.
+        return BatchCreateNodesResponse.model_construct(
             node_ids=node_ids,
             message=f"Successfully created {len(node_ids)} nodes",
         )
 
     async def batch_create_relationships(
-        self, relationships: List[Dict[str, Any]]
+        self, relationships: List[Dict[str, Any]], max_concurrency: int = 32
     ) -> "BatchCreateRelationshipsResponse":
         """Batch create multiple relationships.
 
+        Relationships are sent in one request to
+        ``/data/relationships/batch`` when the server provides it. Otherwise
+        they are created concurrently, at most ``max_concurrency`` requests
+        in flight at a time. Returned IDs keep the order of
+        ``relationships``.
+
         Args:
-            relationships: List of relationship definitions, each with 'source_id', 'target_id', 'rel_type', and 'properties'
+            relationships: List of relationship definitions, each with 'source_id',
+                'target_id', 'rel_type', and 'properties'
+            max_concurrency: Maximum number of concurrent create requests
 
         Returns:
             BatchCreateRelationshipsResponse containing list of created relationship IDs
 
         Raises:
+            ValidationError: If any input item is invalid (nothing is sent)
+                or any create fails
             ApiError: If the API returns an error
         """
         from nexus_sdk.models import (
@@ -847,36 +1463,56 @@ class NexusClient:
             BatchCreateRelationshipsResponse,
         )
 
-        # For now, create relationships sequentially
-        # TODO: Implement proper batch endpoint if available
-        rel_ids = []
-        errors = []
+        batch_rels = _validate_batch(BatchRelationship, relationships, "relationship")
+        data = await self._post_bulk(
+            "/data/relationships/batch",
+            {"relationships": [rel.model_dump() for rel in batch_rels]},
+        )
+        if data is not None:
+            rel_ids = data.get("rel_ids", [])
+            return BatchCreateRelationshipsResponse(
+                rel_ids=rel_ids,
+                message=data.get(
+                    "message", f"Successfully created {len(rel_ids)} relationships"
+                ),
+            )
 
-        for rel_data in relationships:
-            try:
-                batch_rel = BatchRelationship(**rel_data)
-                response = await self.create_relationship(
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _one(batch_rel: BatchRelationship) -> CreateRelationshipResponse:
+            async with sem:
+                return await self.create_relationship(
                     batch_rel.source_id,
                     batch_rel.target_id,
                     batch_rel.rel_type,
                     batch_rel.properties,
                 )
-                rel_ids.append(response.relationship_id)
-            except Exception as e:
-                errors.append(f"Failed to create relationship: {e}")
 
-        if errors:
-            from nexus_sdk.error import ValidationError
+        results = await asyncio.gather(
+            *(_one(r) for r in batch_rels), return_exceptions=True
+        )
 
+        rel_ids = []
+        errors = []
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                errors.append(f"Failed to create relationship {index}: {result}")
+            elif result.error:
+                errors.append(f"Failed to create relationship {index}: {result.error}")
+            else:
+                rel_ids.append(result.relationship_id)
+
+        if errors:
             raise ValidationError(
                 f"Some relationships failed to create: {', '.join(errors)}"
             )
 
-        return BatchCreateRelationshipsResponse(
+        return BatchCreateRelationshipsResponse.model_construct(
             rel_ids=rel_ids,
             message=f"Successfully created {len(rel_ids)} relationships",
         )
 
+    @_cached_read(lambda: "/performance/statistics")
     async def get_query_statistics(self) -> "QueryStatisticsResponse":
         """Get query statistics.
 
@@ -888,19 +1524,8 @@ class NexusClient:
         """
         from nexus_sdk.models import QueryStatisticsResponse
 
-        url = urljoin(self.base_url, "/performance/statistics")
-        response = await self._execute_with_retry("GET", url)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return QueryStatisticsResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        url = f"{self.base_url}/performance/statistics"
+        return await self._request_and_parse("GET", url, QueryStatisticsResponse)
 
     async def get_slow_queries(self) -> "SlowQueriesResponse":
         """Get slow queries.
@@ -913,19 +1538,8 @@ class NexusClient:
         """
         from nexus_sdk.models import SlowQueriesResponse
 
-        url = urljoin(self.base_url, "/performance/slow-queries")
-        response = await self._execute_with_retry("GET", url)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return SlowQueriesResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        url = f"{self.base_url}/performance/slow-queries"
+        return await self._request_and_parse("GET", url, SlowQueriesResponse)
 
     async def get_plan_cache_statistics(self) -> "PlanCacheStatisticsResponse":
         """Get plan cache statistics.
@@ -938,19 +1552,8 @@ class NexusClient:
         """
         from nexus_sdk.models import PlanCacheStatisticsResponse
 
-        url = urljoin(self.base_url, "/performance/plan-cache")
-        response = await self._execute_with_retry("GET", url)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return PlanCacheStatisticsResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        url = f"{self.base_url}/performance/plan-cache"
+        return await self._request_and_parse("GET", url, PlanCacheStatisticsResponse)
 
     async def clear_plan_cache(self) -> Dict[str, Any]:
         """Clear plan cache.
@@ -961,18 +1564,13 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        url = urljoin(self.base_url, "/performance/plan-cache/clear")
-        response = await self._execute_with_retry("POST", url)
+        url = f"{self.base_url}/performance/plan-cache/clear"
+        response = await self._post(url)
         status = response.status_code
 
         if status == 200:
-            return response.json()
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+            return loads(response.content)
+        _raise_api_error(response)
 
     # =========================================================================
     # Database Management Methods
@@ -987,19 +1585,8 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        url = urljoin(self.base_url, "/databases")
-        response = await self._execute_with_retry("GET", url)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return ListDatabasesResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        url = self._url_databases
+        return await self._request_and_parse("GET", url, ListDatabasesResponse)
 
     async def create_database(self, name: str) -> CreateDatabaseResponse:
         """Create a new database.
@@ -1013,21 +1600,10 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error (e.g., database already exists)
         """
-        url = urljoin(self.base_url, "/databases")
-        payload = CreateDatabaseRequest(name=name).model_dump()
+        url = self._url_databases
+        payload = {"name": name}
 
-        response = await self._execute_with_retry("POST", url, json=payload)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return CreateDatabaseResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        return await self._request_and_parse("POST", url, CreateDatabaseResponse, json=payload)
 
     async def get_database(self, name: str) -> DatabaseInfo:
         """Get database information.
@@ -1041,19 +1617,8 @@ class NexusClient:
         Raises:
             ApiError: If the database is not found or API returns an error
         """
-        url = urljoin(self.base_url, f"/databases/{name}")
-        response = await self._execute_with_retry("GET", url)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return DatabaseInfo(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        url = f"{self._url_databases}/{name}"
+        return await self._request_and_parse("GET", url, DatabaseInfo)
 
     async def drop_database(self, name: str) -> DropDatabaseResponse:
         """Drop a database.
@@ -1067,19 +1632,8 @@ class NexusClient:
         Raises:
             ApiError: If the database cannot be dropped (e.g., default database)
         """
-        url = urljoin(self.base_url, f"/databases/{name}")
-        response = await self._execute_with_retry("DELETE", url)
-        status = response.status_code
-
-        if status == 200:
-            data = response.json()
-            return DropDatabaseResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        url = f"{self._url_databases}/{name}"
+        return await self._request_and_parse("DELETE", url, DropDatabaseResponse)
 
     async def get_current_database(self) -> str:
         """Get the current session database.
@@ -1090,19 +1644,14 @@ class NexusClient:
         Raises:
             ApiError: If the API returns an error
         """
-        url = urljoin(self.base_url, "/session/database")
-        response = await self._execute_with_retry("GET", url)
+        url = self._url_session_database
+        response = await self._get(url)
         status = response.status_code
 
         if status == 200:
-            data = response.json()
+            data = loads(response.content)
             return data.get("database", "neo4j")
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        _raise_api_error(response)
 
     async def switch_database(self, name: str) -> SwitchDatabaseResponse:
         """Switch to a different database.
@@ -1116,18 +1665,16 @@ class NexusClient:
         Raises:
             ApiError: If the database does not exist
         """
-        url = urljoin(self.base_url, "/session/database")
-        payload = SwitchDatabaseRequest(name=name).model_dump()
-
-        response = await self._execute_with_retry("PUT", url, json=payload)
-        status = response.status_code
+        url = self._url_session_database
+        payload = {"name": name}
 
-        if status == 200:
-            data = response.json()
-            return SwitchDatabaseResponse(**data)
-        else:
-            try:
-                error_text = response.text
-            except Exception:
-                error_text = f"HTTP {status}"
-            raise ApiError(error_text, status)
+        try:
+            return await self._request_and_parse(
+                "PUT", url, SwitchDatabaseResponse, json=payload
+            )
+        finally:
+            # Everything cached so far was read from the previous database.
+            self._read_cache.clear()
+            self._metadata_cache.clear()
+            self._query_cache.clear()
+            self._inflight.clear()
@@ -19,10 +19,15 @@ class ApiError(NexusError):
     """API error response."""
 
     def __init__(self, message: str, status: int):
-        super().__init__(f"API error: {message} (status: {status})")
+        # Keep both values in args so the error pickles; the display string
+        # is only built if the error is actually printed.
+        super().__init__(message, status)
         self.message = message
         self.status = status
 
+    def __str__(self) -> str:
+        return f"API error: {self.message} (status: {self.status})"
+
 
 class AuthenticationError(NexusError):
     """Authentication failed."""
@@ -12,43 +12,25 @@ async def main():
         result = await client.execute_cypher("MATCH (n) RETURN n LIMIT 10", None)
         print(f"Found {len(result.rows)} rows")
 
-        # Create a node
-        create_response = await client.create_node(
-            labels=["Person"], properties={"name": "Alice", "age": 30}
+        # Create both nodes and the relationship between them in a single
+        # round-trip instead of one request per entity. Returning the node
+        # itself avoids a follow-up get_node() just to read it back.
+        result = await client.execute_cypher(
+            "CREATE (a:Person {name: $a_name, age: $a_age})"
+            "-[r:KNOWS {since: $since}]->"
+            "(b:Person {name: $b_name, age: $b_age}) "
+            "RETURN id(a) AS a_id, a, id(b) AS b_id, id(r) AS r_id",
+            {"a_name": "Alice", "a_age": 31, "b_name": "Bob", "b_age": 25, "since": 2020},
         )
-        print(f"Created node with ID: {create_response.node_id}")
-
-        # Get a node
-        node = await client.get_node(create_response.node_id)
-        if node:
-            print(f"Node: {node}")
-
-        # Update a node
-        update_response = await client.update_node(
-            create_response.node_id, properties={"age": 31}
-        )
-        print(f"Updated node: {update_response.node}")
-
-        # Create another node
-        create_response2 = await client.create_node(
-            labels=["Person"], properties={"name": "Bob", "age": 25}
-        )
-
-        # Create a relationship
-        rel_response = await client.create_relationship(
-            source_id=create_response.node_id,
-            target_id=create_response2.node_id,
-            rel_type="KNOWS",
-            properties={"since": 2020},
-        )
-        print(f"Created relationship with ID: {rel_response.relationship_id}")
-
-        # Get database statistics
-        stats = await client.get_stats()
+        a_id, alice, b_id, r_id = result.rows[0]
+        print(f"Created nodes with IDs: {a_id}, {b_id}")
+        print(f"Node: {alice}")
+        print(f"Created relationship with ID: {r_id}")
+
+        # Statistics and health are independent reads — pipeline them
+        async with client.pipeline() as p:
+            stats, healthy = await p.get_stats().health_check().execute()
         print(f"Database stats: {stats}")
-
-        # Health check
-        healthy = await client.health_check()
         print(f"Server is healthy: {healthy}")
 
 
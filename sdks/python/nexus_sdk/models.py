@@ -1,10 +1,20 @@
 """Data models for Nexus SDK."""
 
 from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class QueryResult(BaseModel):
+class _Model(BaseModel):
+    """Base for SDK models.
+
+    Validation schemas are built on first use rather than at import, so
+    importing the SDK only pays for the models a program actually touches.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class QueryResult(_Model):
     """Cypher query result."""
 
     columns: List[str] = Field(default_factory=list)
@@ -12,18 +22,27 @@ class QueryResult(BaseModel):
     execution_time_ms: Optional[int] = Field(None, alias="execution_time_ms")
     error: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
+
+    def as_columns(self) -> Dict[str, List[Any]]:
+        """Return the rows column-wise, one list of values per column.
+
+        Handy for single-column scans and for dataframe libraries, e.g.
+        ``polars.DataFrame(result.as_columns())``.
+        """
+        if not self.rows:
+            return {column: [] for column in self.columns}
+        return {column: list(values) for column, values in zip(self.columns, zip(*self.rows))}
 
 
-class DatabaseStats(BaseModel):
+class DatabaseStats(_Model):
     """Database statistics."""
 
     catalog: Dict[str, Any] = Field(default_factory=dict)
     storage: Dict[str, Any] = Field(default_factory=dict)
 
 
-class Node(BaseModel):
+class Node(_Model):
     """Graph node."""
 
     id: int
@@ -31,7 +50,7 @@ class Node(BaseModel):
     properties: Dict[str, Any] = Field(default_factory=dict)
 
 
-class Relationship(BaseModel):
+class Relationship(_Model):
     """Graph relationship."""
 
     id: int
@@ -41,7 +60,7 @@ class Relationship(BaseModel):
     properties: Dict[str, Any] = Field(default_factory=dict)
 
 
-class CreateNodeRequest(BaseModel):
+class CreateNodeRequest(_Model):
     """Request to create a node."""
 
     labels: List[str] = Field(default_factory=list)
@@ -64,7 +83,7 @@ class CreateNodeRequest(BaseModel):
         return data
 
 
-class CreateNodeResponse(BaseModel):
+class CreateNodeResponse(_Model):
     """Response from creating a node."""
 
     node_id: int
@@ -73,7 +92,7 @@ class CreateNodeResponse(BaseModel):
     error: Optional[str] = None
 
 
-class GetNodeByExternalIdResponse(BaseModel):
+class GetNodeByExternalIdResponse(_Model):
     """Response from resolving a node by external id (Phase9 §5.5)."""
 
     node: Optional[Node] = None
@@ -81,7 +100,7 @@ class GetNodeByExternalIdResponse(BaseModel):
     error: Optional[str] = None
 
 
-class UpdateNodeRequest(BaseModel):
+class UpdateNodeRequest(_Model):
     """Request to update a node."""
 
     node_id: int
@@ -89,27 +108,27 @@ class UpdateNodeRequest(BaseModel):
     properties: Optional[Dict[str, Any]] = None
 
 
-class UpdateNodeResponse(BaseModel):
+class UpdateNodeResponse(_Model):
     """Response from updating a node."""
 
     node: Optional[Node] = None
     error: Optional[str] = None
 
 
-class DeleteNodeRequest(BaseModel):
+class DeleteNodeRequest(_Model):
     """Request to delete a node."""
 
     node_id: int
 
 
-class DeleteNodeResponse(BaseModel):
+class DeleteNodeResponse(_Model):
     """Response from deleting a node."""
 
     success: bool = True
     error: Optional[str] = None
 
 
-class CreateRelationshipRequest(BaseModel):
+class CreateRelationshipRequest(_Model):
     """Request to create a relationship."""
 
     source_id: int
@@ -118,7 +137,7 @@ class CreateRelationshipRequest(BaseModel):
     properties: Dict[str, Any] = Field(default_factory=dict)
 
 
-class CreateRelationshipResponse(BaseModel):
+class CreateRelationshipResponse(_Model):
     """Response from creating a relationship."""
 
     relationship_id: int
@@ -126,34 +145,34 @@ class CreateRelationshipResponse(BaseModel):
     error: Optional[str] = None
 
 
-class UpdateRelationshipRequest(BaseModel):
+class UpdateRelationshipRequest(_Model):
     """Request to update a relationship."""
 
     relationship_id: int
     properties: Dict[str, Any]
 
 
-class UpdateRelationshipResponse(BaseModel):
+class UpdateRelationshipResponse(_Model):
     """Response from updating a relationship."""
 
     relationship: Optional[Relationship] = None
     error: Optional[str] = None
 
 
-class DeleteRelationshipRequest(BaseModel):
+class DeleteRelationshipRequest(_Model):
     """Request to delete a relationship."""
 
     relationship_id: int
 
 
-class DeleteRelationshipResponse(BaseModel):
+class DeleteRelationshipResponse(_Model):
     """Response from deleting a relationship."""
 
     success: bool = True
     error: Optional[str] = None
 
 
-class LabelInfo(BaseModel):
+class LabelInfo(_Model):
     """One entry in `GET /schema/labels`.
 
     Wire shape: ``{"name": "Person", "id": 0}``. The ``id`` field is
@@ -168,28 +187,28 @@ class LabelInfo(BaseModel):
     id: int
 
 
-class RelTypeInfo(BaseModel):
+class RelTypeInfo(_Model):
     """One entry in `GET /schema/rel_types`. Mirrors ``LabelInfo``."""
 
     name: str
     id: int
 
 
-class LabelResponse(BaseModel):
+class LabelResponse(_Model):
     """Response for label operations."""
 
     labels: List[LabelInfo] = Field(default_factory=list)
     error: Optional[str] = None
 
 
-class RelTypeResponse(BaseModel):
+class RelTypeResponse(_Model):
     """Response for relationship type operations."""
 
     types: List[RelTypeInfo] = Field(default_factory=list)
     error: Optional[str] = None
 
 
-class TransactionResponse(BaseModel):
+class TransactionResponse(_Model):
     """Response for transaction operations."""
 
     transaction_id: Optional[str] = None
@@ -201,14 +220,14 @@ class TransactionResponse(BaseModel):
 Value = Union[None, bool, int, float, str, List[Any], Dict[str, Any]]
 
 
-class BatchNode(BaseModel):
+class BatchNode(_Model):
     """Batch node definition."""
 
     labels: List[str] = Field(default_factory=list)
     properties: Dict[str, Any] = Field(default_factory=dict)
 
 
-class BatchRelationship(BaseModel):
+class BatchRelationship(_Model):
     """Batch relationship definition."""
 
     source_id: int
@@ -217,13 +236,13 @@ class BatchRelationship(BaseModel):
     properties: Dict[str, Any] = Field(default_factory=dict)
 
 
-class BatchCreateNodesRequest(BaseModel):
+class BatchCreateNodesRequest(_Model):
     """Request to batch create nodes."""
 
     nodes: List[BatchNode] = Field(default_factory=list)
 
 
-class BatchCreateNodesResponse(BaseModel):
+class BatchCreateNodesResponse(_Model):
     """Response from batch creating nodes."""
 
     node_ids: List[int] = Field(default_factory=list)
@@ -231,13 +250,13 @@ class BatchCreateNodesResponse(BaseModel):
     error: Optional[str] = None
 
 
-class BatchCreateRelationshipsRequest(BaseModel):
+class BatchCreateRelationshipsRequest(_Model):
     """Request to batch create relationships."""
 
     relationships: List[BatchRelationship] = Field(default_factory=list)
 
 
-class BatchCreateRelationshipsResponse(BaseModel):
+class BatchCreateRelationshipsResponse(_Model):
     """Response from batch creating relationships."""
 
     rel_ids: List[int] = Field(default_factory=list)
@@ -245,7 +264,7 @@ class BatchCreateRelationshipsResponse(BaseModel):
     error: Optional[str] = None
 
 
-class QueryStatisticsSummary(BaseModel):
+class QueryStatisticsSummary(_Model):
     """Query statistics summary."""
 
     total_queries: int = 0
@@ -258,7 +277,7 @@ class QueryStatisticsSummary(BaseModel):
     slow_query_count: int = 0
 
 
-class QueryPatternStats(BaseModel):
+class QueryPatternStats(_Model):
     """Query pattern statistics."""
 
     pattern: str = ""
@@ -270,14 +289,14 @@ class QueryPatternStats(BaseModel):
     failure_count: int = 0
 
 
-class QueryStatisticsResponse(BaseModel):
+class QueryStatisticsResponse(_Model):
     """Query statistics response."""
 
     statistics: QueryStatisticsSummary = Field(default_factory=QueryStatisticsSummary)
     patterns: List[QueryPatternStats] = Field(default_factory=list)
 
 
-class SlowQueryRecord(BaseModel):
+class SlowQueryRecord(_Model):
     """Slow query record."""
 
     query: str = ""
@@ -288,14 +307,14 @@ class SlowQueryRecord(BaseModel):
     rows_returned: int = 0
 
 
-class SlowQueriesResponse(BaseModel):
+class SlowQueriesResponse(_Model):
     """Slow queries response."""
 
     count: int = 0
     queries: List[SlowQueryRecord] = Field(default_factory=list)
 
 
-class PlanCacheStatisticsResponse(BaseModel):
+class PlanCacheStatisticsResponse(_Model):
     """Plan cache statistics response."""
 
     cached_plans: int = 0
@@ -308,7 +327,7 @@ class PlanCacheStatisticsResponse(BaseModel):
 # Database management models
 
 
-class DatabaseInfo(BaseModel):
+class DatabaseInfo(_Model):
     """Database information."""
 
     name: str
@@ -319,20 +338,20 @@ class DatabaseInfo(BaseModel):
     storage_size: int = 0
 
 
-class ListDatabasesResponse(BaseModel):
+class ListDatabasesResponse(_Model):
     """Response for listing databases."""
 
     databases: List[DatabaseInfo] = Field(default_factory=list)
     default_database: str = "neo4j"
 
 
-class CreateDatabaseRequest(BaseModel):
+class CreateDatabaseRequest(_Model):
     """Request to create a database."""
 
     name: str
 
 
-class CreateDatabaseResponse(BaseModel):
+class CreateDatabaseResponse(_Model):
     """Response from creating a database."""
 
     success: bool = True
@@ -340,26 +359,26 @@ class CreateDatabaseResponse(BaseModel):
     message: str = ""
 
 
-class DropDatabaseResponse(BaseModel):
+class DropDatabaseResponse(_Model):
     """Response from dropping a database."""
 
     success: bool = True
     message: str = ""
 
 
-class SessionDatabaseResponse(BaseModel):
+class SessionDatabaseResponse(_Model):
     """Response for session database operations."""
 
     database: str = ""
 
 
-class SwitchDatabaseRequest(BaseModel):
+class SwitchDatabaseRequest(_Model):
     """Request to switch database."""
 
     name: str
 
 
-class SwitchDatabaseResponse(BaseModel):
+class SwitchDatabaseResponse(_Model):
     """Response from switching database."""
 
     success: bool = True
@@ -1,16 +1,46 @@
 """Query builder for constructing Cypher queries in a type-safe manner."""
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# Clause keywords, rendered in the order the builder methods are called.
+_MATCH = "MATCH"
+_CREATE = "CREATE"
+_MERGE = "MERGE"
+_WHERE = "WHERE"
+_RETURN = "RETURN"
+_SET = "SET"
+_DELETE = "DELETE"
+_WITH = "WITH"
+_ORDER_BY = "ORDER BY"
+_LIMIT = "LIMIT"
+_SKIP = "SKIP"
 
 
 class QueryBuilder:
     """Query builder for constructing Cypher queries."""
 
+    __slots__ = ("_parts", "_params", "_query", "_built")
+
     def __init__(self):
         """Create a new query builder."""
+        # Keywords and their arguments alternate; joining with spaces
+        # renders each clause without building a per-clause string.
         self._parts: List[str] = []
-        self._params: Dict[str, Any] = {}
-        self._current_clause: Optional[str] = None
+        # Created on the first param() call; most queries never need one.
+        self._params: Optional[Dict[str, Any]] = None
+        # Rendered query text; reset by clause methods, kept by param() so
+        # a template can be rebuilt with new parameters without re-joining.
+        self._query: Optional[str] = None
+        # Parameterless build() result, handed out again until the next
+        # clause; BuiltQuery is immutable so sharing it is safe.
+        self._built: Optional[BuiltQuery] = None
+
+    def _add(self, keyword: str, text: str) -> "QueryBuilder":
+        """Append a clause and drop the cached query text."""
+        self._parts.extend((keyword, text))
+        self._query = None
+        self._built = None
+        return self
 
     def match_(self, pattern: str) -> "QueryBuilder":
         """Add a MATCH clause.
@@ -21,9 +51,7 @@ class QueryBuilder:
         Returns:
             QueryBuilder instance for chaining
         """
-        self._parts.append(f"MATCH {pattern}")
-        self._current_clause = "MATCH"
-        return self
+        return self._add(_MATCH, pattern)
 
     def create(self, pattern: str) -> "QueryBuilder":
         """Add a CREATE clause.
@@ -34,9 +62,7 @@ class QueryBuilder:
         Returns:
             QueryBuilder instance for chaining
         """
-        self._parts.append(f"CREATE {pattern}")
-        self._current_clause = "CREATE"
-        return self
+        return self._add(_CREATE, pattern)
 
     def merge(self, pattern: str) -> "QueryBuilder":
         """Add a MERGE clause.
@@ -47,9 +73,7 @@ class QueryBuilder:
         Returns:
             QueryBuilder instance for chaining
         """
-        self._parts.append(f"MERGE {pattern}")
-        self._current_clause = "MERGE"
-        return self
+        return self._add(_MERGE, pattern)
 
     def where_(self, condition: str) -> "QueryBuilder":
         """Add a WHERE clause.
@@ -60,9 +84,7 @@ class QueryBuilder:
         Returns:
             QueryBuilder instance for chaining
         """
-        self._parts.append(f"WHERE {condition}")
-        self._current_clause = "WHERE"
-        return self
+        return self._add(_WHERE, condition)
 
     def return_(self, items: str) -> "QueryBuilder":
         """Add a RETURN clause.
@@ -73,9 +95,7 @@ class QueryBuilder:
         Returns:
             QueryBuilder instance for chaining
         """
-        self._parts.append(f"RETURN {items}")
-        self._current_clause = "RETURN"
-        return self
+        return self._add(_RETURN, items)
 
     def set_(self, assignments: str) -> "QueryBuilder":
         """Add a SET clause.
@@ -86,9 +106,7 @@ class QueryBuilder:
         Returns:
             QueryBuilder instance for chaining
         """
-        self._parts.append(f"SET {assignments}")
-        self._current_clause = "SET"
-        return self
+        return self._add(_SET, assignments)
 
     def delete(self, items: str) -> "QueryBuilder":
         """Add a DELETE clause.
@@ -99,9 +117,7 @@ class QueryBuilder:
         Returns:
             QueryBuilder instance for chaining
         """
-        self._parts.append(f"DELETE {items}")
-        self._current_clause = "DELETE"
-        return self
+        return self._add(_DELETE, items)
 
     def with_(self, items: str) -> "QueryBuilder":
         """Add a WITH clause.
@@ -112,9 +128,7 @@ class QueryBuilder:
         Returns:
             QueryBuilder instance for chaining
         """
-        self._parts.append(f"WITH {items}")
-        self._current_clause = "WITH"
-        return self
+        return self._add(_WITH, items)
 
     def order_by(self, expression: str) -> "QueryBuilder":
         """Add an ORDER BY clause.
@@ -125,9 +139,7 @@ class QueryBuilder:
         Returns:
             QueryBuilder instance for chaining
         """
-        self._parts.append(f"ORDER BY {expression}")
-        self._current_clause = "ORDER_BY"
-        return self
+        return self._add(_ORDER_BY, expression)
 
     def limit(self, count: int) -> "QueryBuilder":
         """Add a LIMIT clause.
@@ -138,9 +150,7 @@ class QueryBuilder:
         Returns:
             QueryBuilder instance for chaining
         """
-        self._parts.append(f"LIMIT {count}")
-        self._current_clause = "LIMIT"
-        return self
+        return self._add(_LIMIT, str(count))
 
     def skip(self, count: int) -> "QueryBuilder":
         """Add a SKIP clause.
@@ -151,9 +161,7 @@ class QueryBuilder:
         Returns:
             QueryBuilder instance for chaining
         """
-        self._parts.append(f"SKIP {count}")
-        self._current_clause = "SKIP"
-        return self
+        return self._add(_SKIP, str(count))
 
     def param(self, name: str, value: Any) -> "QueryBuilder":
         """Add a query parameter.
@@ -165,18 +173,29 @@ class QueryBuilder:
         Returns:
             QueryBuilder instance for chaining
         """
+        if self._params is None:
+            self._params = {}
         self._params[name] = value
         return self
 
-    def build(self) -> "BuiltQuery":
+    def build(self, share_params: bool = False) -> "BuiltQuery":
         """Build the query.
 
+        Args:
+            share_params: Return the builder's own parameters dictionary
+                instead of a copy. Saves the copy when the result is passed
+                straight to ``execute_cypher``; the caller must then not
+                mutate it.
+
         Returns:
             BuiltQuery object containing query string and parameters
         """
-        query = " ".join(self._parts)
-        params = self._params.copy() if self._params else None
-        return BuiltQuery(query, params)
+        if self._params:
+            params = self._params if share_params else self._params.copy()
+            return BuiltQuery(self.query(), params)
+        if self._built is None:
+            self._built = BuiltQuery(self.query())
+        return self._built
 
     def query(self) -> str:
         """Get the query string without building.
@@ -184,15 +203,23 @@ class QueryBuilder:
         Returns:
             Query string
         """
-        return " ".join(self._parts)
+        if self._query is None:
+            self._query = " ".join(self._parts)
+        return self._query
 
-    def params(self) -> Optional[Dict[str, Any]]:
+    def params(self, share: bool = False) -> Optional[Dict[str, Any]]:
         """Get the parameters without building.
 
+        Args:
+            share: Return the builder's own dictionary instead of a copy;
+                the caller must then not mutate it.
+
         Returns:
             Parameters dictionary or None
         """
-        return self._params.copy() if self._params else None
+        if not self._params:
+            return None
+        return self._params if share else self._params.copy()
 
     def into_parts(self) -> Tuple[str, Optional[Dict[str, Any]]]:
         """Get query and parameters as separate parts.
@@ -203,35 +230,17 @@ class QueryBuilder:
         return (self.query(), self.params())
 
 
-class BuiltQuery:
-    """Built query with query string and parameters."""
+class BuiltQuery(NamedTuple):
+    """Built query with query string and parameters.
 
-    def __init__(self, query: str, params: Optional[Dict[str, Any]] = None):
-        """Create a built query.
+    Unpacks as ``query, params = builder.build()``.
+    """
 
-        Args:
-            query: Cypher query string
-            params: Optional parameters dictionary
-        """
-        self._query = query
-        self._params = params
-
-    @property
-    def query(self) -> str:
-        """Get the query string."""
-        return self._query
-
-    @property
-    def params(self) -> Optional[Dict[str, Any]]:
-        """Get the parameters."""
-        return self._params
+    query: str
+    params: Optional[Dict[str, Any]] = None
 
     def __str__(self) -> str:
         """String representation."""
-        if self._params:
-            return f"Query: {self._query}\nParams: {self._params}"
-        return f"Query: {self._query}"
-
-    def __repr__(self) -> str:
-        """Representation."""
-        return f"BuiltQuery(query={self._query!r}, params={self._params!r})"
+        if self.params:
+            return f"Query: {self.query}\nParams: {self.params}"
+        return f"Query: {self.query}"
@@ -1,7 +1,11 @@
 """Tests for NexusClient."""
 
+import asyncio
+
+import httpx
 import pytest
 from nexus_sdk import NexusClient
+from nexus_sdk.error import ApiError, ValidationError
 
 
 def test_client_creation():
@@ -37,3 +41,828 @@ async def test_client_context_manager():
     """Test client as context manager."""
     async with NexusClient("http://localhost:15474") as client:
         assert client.base_url == "http://localhost:15474"
+
+
+@pytest.mark.asyncio
+async def test_client_shared_http_client_is_not_closed():
+    """A caller-supplied httpx client outlives the NexusClients using it."""
+    async with httpx.AsyncClient() as http_client:
+        for api_key in ("key-a", "key-b"):
+            async with NexusClient(
+                "http://localhost:15474", api_key=api_key, http_client=http_client
+            ) as client:
+                assert client._client is http_client
+        assert not http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_pipeline_executes_queued_calls_in_order():
+    """Pipelined calls run together and results keep queue order."""
+
+    async def get_stats():
+        await asyncio.sleep(0.01)
+        return "stats"
+
+    async def health_check():
+        return True
+
+    client = NexusClient("http://localhost:15474")
+    client.get_stats = get_stats
+    client.health_check = health_check
+    async with client.pipeline() as p:
+        p.get_stats().health_check()
+        assert len(p) == 2
+        assert await p.execute() == ["stats", True]
+        assert len(p) == 0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_errors():
+    """Failures surface after all calls; stateful calls cannot be queued."""
+
+    async def get_stats():
+        raise ApiError("boom", 500)
+
+    async def health_check():
+        return True
+
+    client = NexusClient("http://localhost:15474")
+    client.get_stats = get_stats
+    client.health_check = health_check
+    p = client.pipeline()
+    with pytest.raises(AttributeError):
+        p.begin_transaction()
+    with pytest.raises(ValidationError):
+        await p.execute()
+
+    p.get_stats().health_check()
+    with pytest.raises(ApiError):
+        await p.execute()
+
+    p.get_stats().health_check()
+    error, healthy = await p.execute(raise_on_error=False)
+    assert isinstance(error, ApiError)
+    assert healthy is True
+
+
+@pytest.mark.asyncio
+async def test_execute_many_preserves_order():
+    """execute_many returns one result per query in input order."""
+    seen = []
+
+    async def execute_cypher(query, parameters=None):
+        seen.append(query)
+        await asyncio.sleep(0.01 if query == "A" else 0)
+        return (query, parameters)
+
+    client = NexusClient("http://localhost:15474")
+    client.execute_cypher = execute_cypher
+    results = await client.execute_many([("A", {"x": 1}), ("B", None)])
+    assert results == [("A", {"x": 1}), ("B", None)]
+    assert sorted(seen) == ["A", "B"]
+
+
+@pytest.mark.asyncio
+async def test_batch_create_nodes_concurrent_in_order():
+    """batch_create_nodes bounds concurrency and keeps input order."""
+    from nexus_sdk.models import CreateNodeResponse
+
+    in_flight = 0
+    peak = 0
+
+    async def create_node(labels, properties=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 if properties["i"] % 2 else 0)
+        in_flight -= 1
+        return CreateNodeResponse(node_id=properties["i"] + 1, message="ok")
+
+    client = NexusClient("http://localhost:15474")
+    client._bulk_unsupported.add("/data/nodes/batch")
+    client.create_node = create_node
+    nodes = [{"labels": ["N"], "properties": {"i": i}} for i in range(10)]
+    response = await client.batch_create_nodes(nodes, max_concurrency=3)
+    assert response.node_ids == list(range(1, 11))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_create_nodes_reports_error_replies():
+    """A 200 reply carrying an error fails the batch instead of being dropped."""
+    import json
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/data/nodes/batch":
+            return httpx.Response(404, text="not found")
+        i = json.loads(request.content)["properties"]["i"]
+        if i == 1:
+            return httpx.Response(200, json={"node_id": 0, "error": "bad label"})
+        return httpx.Response(200, json={"node_id": i + 10, "message": "ok"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http)
+        nodes = [{"labels": ["N"], "properties": {"i": i}} for i in range(3)]
+        with pytest.raises(ValidationError, match="node 1: bad label"):
+            await client.batch_create_nodes(nodes)
+
+
+@pytest.mark.asyncio
+async def test_batch_create_nodes_bulk_endpoint():
+    """The bulk endpoint is used when present and probed once when absent."""
+    from nexus_sdk.models import CreateNodeResponse
+
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if supported:
+            return httpx.Response(200, json={"node_ids": [7, 8]})
+        return httpx.Response(404, text="not found")
+
+    async def create_node(labels, properties=None):
+        return CreateNodeResponse(node_id=1, message="ok")
+
+    nodes = [{"labels": ["N"]}, {"labels": ["N"]}]
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        supported = True
+        client = NexusClient("http://localhost:15474", http_client=http)
+        response = await client.batch_create_nodes(nodes)
+        assert response.node_ids == [7, 8]
+
+        supported = False
+        client = NexusClient("http://localhost:15474", http_client=http)
+        client.create_node = create_node
+        await client.batch_create_nodes(nodes)
+        await client.batch_create_nodes(nodes)
+        assert requests == ["/data/nodes/batch"] * 2
+
+
+@pytest.mark.asyncio
+async def test_auth_headers_built_once():
+    """Auth headers are client defaults when owned, per request when shared."""
+    client = NexusClient("http://localhost:15474", api_key="secret")
+    assert client._client.headers["X-API-Key"] == "secret"
+    await client.close()
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("X-API-Key"))
+        return httpx.Response(200, json={"node_id": 1})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", api_key="secret", http_client=http)
+        await client.create_node(["N"], {})
+    assert seen == ["secret"]
+
+
+@pytest.mark.asyncio
+async def test_retry_only_idempotent_requests(monkeypatch):
+    """GETs retry 5xx; POSTs retry only when the request was never sent."""
+    from nexus_sdk import client as client_module
+    from nexus_sdk.error import TimeoutError as NexusTimeoutError
+
+    async def no_sleep(attempt):
+        pass
+
+    monkeypatch.setattr(client_module, "_sleep_backoff", no_sleep)
+    answers = []
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        answer = answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return httpx.Response(answer, json={"node_id": 1, "node": {"id": 1, "labels": []}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http)
+
+        answers[:] = [503, 200]
+        assert (await client.get_node(1)).id == 1
+
+        answers[:] = [503]
+        with pytest.raises(ApiError):
+            await client.create_node(["N"], {})
+
+        answers[:] = [httpx.ConnectError("refused"), 200]
+        assert (await client.create_node(["N"], {})).node_id == 1
+
+        answers[:] = [httpx.ReadTimeout("slow")]
+        with pytest.raises(NexusTimeoutError):
+            await client.create_node(["N"], {})
+
+    assert calls == ["GET", "GET", "POST", "POST", "POST", "POST"]
+
+
+@pytest.mark.asyncio
+async def test_read_cache_hits_and_invalidation():
+    """Cached reads skip the round-trip until a write evicts them."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        if request.method == "GET":
+            return httpx.Response(200, json={"node": {"id": 1, "labels": ["N"], "properties": {}}})
+        return httpx.Response(200, json={"success": True, "message": ""})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http, read_cache_size=8)
+        first = await client.get_node(1)
+        assert await client.get_node(1) is first
+        assert await client.get_node(node_id=1) is first
+        await client.delete_node(1)
+        await client.get_node(1)
+
+        uncached = NexusClient("http://localhost:15474", http_client=http)
+        await uncached.get_node(1)
+
+    assert [m for m, _ in calls] == ["GET", "DELETE", "GET", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_query_cache_serves_repeated_reads_until_a_write():
+    """Identical read queries hit the cache; write queries clear it."""
+    import json
+
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content)["query"])
+        return httpx.Response(200, json={"columns": ["c"], "rows": [[1]]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http, query_cache_size=8)
+        read = "MATCH (n) RETURN count(n) AS c"
+        first = await client.execute_cypher(read)
+        assert await client.execute_cypher(read) is first
+        await client.execute_cypher(read, {"x": 1})
+        await client.execute_cypher("CREATE (n:N)")
+        await client.execute_cypher(read)
+        await client.execute_cypher(read, cache=False)
+        # Parameters that can't be keyed as JSON just skip the cache.
+        await client.execute_cypher(read, {"b": b"\x00"})
+
+    assert sent == [read, read, "CREATE (n:N)", read, read, read]
+    assert client.cache_stats() == {"hits": 1, "misses": 3, "size": 1}
+
+
+@pytest.mark.asyncio
+async def test_prewarm_opens_connections_on_enter():
+    """prewarm=True sends the warm-up health requests in __aenter__."""
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"status": "ok"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        async with NexusClient("http://localhost:15474", http_client=http, prewarm=True):
+            assert paths == ["/health"] * 5
+
+        paths.clear()
+        async with NexusClient("http://localhost:15474", http_client=http):
+            assert paths == []
+
+
+@pytest.mark.asyncio
+async def test_warm_up_rest_probes_use_short_timeout():
+    """Unanswered REST probes give up after warm_up's timeout."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.extensions["timeout"]["read"] > 0.05:
+            await asyncio.sleep(5)
+        raise httpx.ReadTimeout("no answer", request=request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("nexus://127.0.0.1:1", http_client=http)
+
+        async def health(request):
+            return None
+
+        client._transport.execute = health
+        await asyncio.wait_for(client.warm_up(timeout=0.05), 1.0)
+
+
+@pytest.mark.asyncio
+async def test_request_body_encoded_once_as_json():
+    """JSON payloads are sent as pre-encoded bytes with a JSON content type."""
+    import json
+
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append((request.headers["Content-Type"], json.loads(request.content)))
+        return httpx.Response(200, json={"node_id": 5})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http)
+        response = await client.create_node(["N"], {"name": "é"})
+    assert response.node_id == 5
+    assert bodies[0][0] == "application/json"
+    assert bodies[0][1]["labels"] == ["N"]
+    assert bodies[0][1]["properties"] == {"name": "é"}
+
+
+@pytest.mark.asyncio
+async def test_execute_cypher_stream_yields_rows():
+    """execute_cypher_stream yields every row in order."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"columns": ["n"], "rows": [[1], [2.5], ["x"]]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http)
+        rows = [row async for row in client.execute_cypher_stream("RETURN 1")]
+        dicts = [row async for row in client.execute_cypher_stream("RETURN 1", as_dicts=True)]
+    assert rows == [[1], [2.5], ["x"]]
+    assert dicts == [{"n": 1}, {"n": 2.5}, {"n": "x"}]
+
+
+@pytest.mark.asyncio
+async def test_execute_cypher_stream_parses_incrementally_with_ijson():
+    """With ijson the streamed body yields rows and raises on an error field."""
+    pytest.importorskip("ijson")
+    bodies = {
+        "RETURN 1": {
+            "columns": ["n", "m"],
+            "rows": [[1, [2, 3]], [2.5, {"a": [1]}]],
+            "execution_time_ms": 1,
+        },
+        "BAD": {"columns": [], "rows": [], "execution_time_ms": 0, "error": "syntax"},
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        import json
+
+        return httpx.Response(200, json=bodies[json.loads(request.content)["query"]])
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http)
+        rows = [row async for row in client.execute_cypher_stream("RETURN 1")]
+        dicts = [row async for row in client.execute_cypher_stream("RETURN 1", as_dicts=True)]
+        for as_dicts in (False, True):
+            with pytest.raises(ApiError, match="syntax"):
+                async for _ in client.execute_cypher_stream("BAD", as_dicts=as_dicts):
+                    pass
+
+    assert rows == [[1, [2, 3]], [2.5, {"a": [1]}]]
+    assert dicts == [{"n": 1, "m": [2, 3]}, {"n": 2.5, "m": {"a": [1]}}]
+
+
+@pytest.mark.asyncio
+async def test_execute_cypher_validates_only_when_asked():
+    """Results are trusted by default; validate_responses rejects bad rows."""
+    import pydantic
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"columns": ["n"], "rows": "oops"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http)
+        result = await client.execute_cypher("RETURN 1")
+        assert result.columns == ["n"]
+
+        strict = NexusClient("http://localhost:15474", http_client=http, validate_responses=True)
+        with pytest.raises(pydantic.ValidationError):
+            await strict.execute_cypher("RETURN 1")
+
+
+def test_query_result_as_columns():
+    """as_columns transposes rows into one list per column."""
+    from nexus_sdk.models import QueryResult
+
+    result = QueryResult(columns=["a", "b"], rows=[[1, "x"], [2, "y"]])
+    assert result.as_columns() == {"a": [1, 2], "b": ["x", "y"]}
+    assert QueryResult(columns=["a"]).as_columns() == {"a": []}
+
+
+def test_api_error_formats_lazily_and_pickles():
+    """ApiError keeps its display text and survives a pickle round-trip."""
+    import pickle
+
+    error = ApiError("boom", 500)
+    assert str(error) == "API error: boom (status: 500)"
+    restored = pickle.loads(pickle.dumps(error))
+    assert (restored.message, restored.status) == ("boom", 500)
+    assert str(restored) == str(error)
+
+
+@pytest.mark.asyncio
+async def test_batch_input_validated_before_sending():
+    """Invalid batch items are reported by index and nothing is sent."""
+    sent = []
+
+    async def create_relationship(*args, **kwargs):
+        sent.append(args)
+
+    client = NexusClient("http://localhost:15474")
+    client.create_relationship = create_relationship
+    rels = [
+        {"source_id": 1, "target_id": 2, "rel_type": "KNOWS"},
+        {"source_id": 1, "rel_type": "KNOWS"},
+        {"source_id": "x", "target_id": 2, "rel_type": "KNOWS"},
+    ]
+    with pytest.raises(ValidationError) as excinfo:
+        await client.batch_create_relationships(rels)
+    assert "relationship 1:" in str(excinfo.value)
+    assert "relationship 2:" in str(excinfo.value)
+    assert sent == []
+
+
+@pytest.mark.asyncio
+async def test_metadata_cache_until_schema_write():
+    """Schema lists are reused until a write or a Cypher query drops them."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        if request.url.path == "/cypher":
+            return httpx.Response(200, json={"columns": [], "rows": []})
+        if request.method == "GET":
+            return httpx.Response(200, json={"labels": [{"name": "Person", "id": 0}]})
+        return httpx.Response(200, json={"node_id": 1})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http, enable_metadata_cache=True)
+        assert (await client.list_labels()).labels[0].name == "Person"
+        await client.list_labels()
+        await client.create_node(["Movie"], {})
+        await client.list_labels()
+        await client.execute_cypher("CREATE (:Actor)")
+        await client.list_labels()
+
+    assert [path for _, path in calls] == [
+        "/schema/labels",
+        "/data/nodes",
+        "/schema/labels",
+        "/cypher",
+        "/schema/labels",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_in_tx_falls_back_to_explicit_transaction():
+    """Without /cypher/tx the statements run between BEGIN and COMMIT."""
+    import json
+
+    paths = []
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path != "/cypher":
+            return httpx.Response(404, text="not found")
+        query = json.loads(request.content)["query"]
+        queries.append(query)
+        if query == "BAD":
+            # Cypher errors come back as 200 with an error field.
+            return httpx.Response(200, json={"columns": [], "rows": [], "error": "syntax"})
+        return httpx.Response(200, json={"columns": ["q"], "rows": [[query]]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http)
+        result = await client.execute_in_tx(["A", "B"])
+        assert result.rows == [["B"]]
+        with pytest.raises(ApiError, match="syntax"):
+            await client.execute_in_tx(["A", "BAD", "C"])
+        with pytest.raises(ApiError, match="syntax"):
+            await client.execute_in_tx(["BAD", "C"])
+
+    assert paths.count("/cypher/tx") == 1
+    committed = ["BEGIN TRANSACTION", "A", "B", "COMMIT TRANSACTION"]
+    rolled_back = ["BEGIN TRANSACTION", "A", "BAD", "ROLLBACK TRANSACTION"]
+    rolled_back_first = ["BEGIN TRANSACTION", "BAD", "ROLLBACK TRANSACTION"]
+    assert queries == committed + rolled_back + rolled_back_first
+
+
+@pytest.mark.asyncio
+async def test_deferred_transaction_sends_queued_statements_on_commit():
+    """A deferred transaction holds queued statements until commit."""
+    import json
+
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path != "/cypher":
+            return httpx.Response(404, text="not found")
+        body = json.loads(request.content)
+        sent.append((body["query"], body["parameters"]))
+        if body["query"] == "BAD":
+            return httpx.Response(200, json={"columns": [], "rows": [], "error": "syntax"})
+        return httpx.Response(200, json={"columns": ["q"], "rows": [[body["query"]]]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http)
+
+        tx = await client.begin_transaction(deferred=True)
+        await tx.queue("A", {"x": 1})
+        await tx.queue("B")
+        assert sent == []
+        await tx.commit()
+        queries = [query for query, _ in sent]
+        assert queries == ["BEGIN TRANSACTION", "A", "B", "COMMIT TRANSACTION"]
+        assert sent[1] == ("A", {"x": 1})
+
+        sent.clear()
+        tx = await client.begin_transaction(deferred=True)
+        await tx.queue("BAD")
+        await tx.queue("C")
+        with pytest.raises(ApiError, match="syntax"):
+            await tx.commit()
+        assert not tx.is_active()
+        queries = [query for query, _ in sent]
+        assert queries == ["BEGIN TRANSACTION", "BAD", "ROLLBACK TRANSACTION"]
+
+        sent.clear()
+        tx = await client.begin_transaction(deferred=True)
+        await tx.queue("C")
+        result = await tx.execute("D")
+        await tx.commit()
+        assert result.rows == [["D"]]
+        queries = [query for query, _ in sent]
+        assert queries == ["BEGIN TRANSACTION", "C", "D", "COMMIT TRANSACTION"]
+
+        sent.clear()
+        tx = await client.begin_transaction(deferred=True)
+        await tx.queue("BAD")
+        with pytest.raises(ApiError, match="syntax"):
+            await tx.execute("D")
+        await tx.rollback()
+        queries = [query for query, _ in sent]
+        assert queries == ["BEGIN TRANSACTION", "BAD", "ROLLBACK TRANSACTION"]
+
+
+@pytest.mark.asyncio
+async def test_error_body_is_summarised():
+    """API errors carry the JSON error field or a truncated raw body."""
+    bodies = [
+        httpx.Response(400, json={"error": "bad label"}),
+        httpx.Response(502, text="<html>" + "x" * 5000),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return bodies.pop(0)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http)
+        with pytest.raises(ApiError) as first:
+            await client.create_label("Bad")
+        with pytest.raises(ApiError) as second:
+            await client.create_label("Down")
+
+    assert first.value.message == "bad label"
+    assert second.value.status == 502
+    assert len(second.value.message) == 500
+
+
+@pytest.mark.asyncio
+async def test_health_check_fails_fast():
+    """An unresponsive server is reported unhealthy after the timeout."""
+
+    async def execute(req):
+        await asyncio.sleep(10)
+
+    client = NexusClient("http://localhost:15474")
+    client._transport.execute = execute
+    assert await client.health_check(timeout=0.01) is False
+    assert await client.wait_for_healthy(timeout=0.05, interval=0.01) is False
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request():
+    """Concurrent get_node calls for one id send a single request."""
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"node": {"id": 42, "labels": []}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http)
+        nodes = await asyncio.gather(*(client.get_node(42) for _ in range(5)))
+        await client.get_node(42)
+
+    assert [node.id for node in nodes] == [42] * 5
+    assert calls == ["/data/nodes/42"] * 2
+
+
+@pytest.mark.asyncio
+async def test_get_after_write_does_not_join_older_get():
+    """A read issued after this client's write gets a fresh request."""
+    release = asyncio.Event()
+    reads = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "PUT":
+            return httpx.Response(200, json={"node": None})
+        reads.append(request.url.path)
+        name = "old" if len(reads) == 1 else "new"
+        if name == "old":
+            await release.wait()
+        node = {"id": 1, "labels": [], "properties": {"name": name}}
+        return httpx.Response(200, json={"node": node})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http)
+        stale = asyncio.ensure_future(client.get_node(1))
+        await asyncio.sleep(0.01)
+        await client.update_node(1, properties={"name": "new"})
+        fresh = asyncio.ensure_future(client.get_node(1))
+        await asyncio.sleep(0.01)
+        release.set()
+        assert (await fresh).properties["name"] == "new"
+        assert (await stale).properties["name"] == "old"
+
+    assert reads == ["/data/nodes/1"] * 2
+
+
+@pytest.mark.asyncio
+async def test_read_cache_cleared_by_any_rest_write():
+    """Other REST writes, and writes overlapping a read, drop cached reads."""
+    release = asyncio.Event()
+    reads = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return httpx.Response(200, json={"relationship_id": 7, "message": ""})
+        reads.append(request.url.path)
+        if len(reads) == 2:
+            await release.wait()
+        node = {"id": 1, "labels": [], "properties": {"read": len(reads)}}
+        return httpx.Response(200, json={"node": node})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http, read_cache_size=8)
+        await client.get_node(1)
+        await client.create_relationship(1, 2, "KNOWS")
+        pending = asyncio.ensure_future(client.get_node(1))
+        await asyncio.sleep(0.01)
+        await client.create_relationship(1, 2, "KNOWS")
+        release.set()
+        assert (await pending).properties["read"] == 2
+        assert (await client.get_node(1)).properties["read"] == 3
+        assert (await client.get_node(1)).properties["read"] == 3
+
+    assert reads == ["/data/nodes/1"] * 3
+
+
+@pytest.mark.asyncio
+async def test_query_cache_skips_reads_inside_a_transaction():
+    """Reads in a transaction aren't cached; its end drops cached results."""
+    import json
+
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content)["query"])
+        return httpx.Response(200, json={"columns": ["c"], "rows": [[len(sent)]]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http, query_cache_size=8)
+        read = "MATCH (n) RETURN count(n) AS c"
+        await client.execute_cypher(read)
+        tx = await client.begin_transaction()
+        await tx.execute("CREATE (n:N)")
+        inside = await tx.execute(read)
+        assert (await tx.execute(read)) is not inside
+        await tx.rollback()
+        after = await client.execute_cypher(read)
+        assert after.rows != inside.rows
+        assert await client.execute_cypher(read) is after
+
+        await client.execute_cypher("BEGIN TRANSACTION")
+        await client.execute_cypher(read)
+        await client.execute_cypher(read)
+        await client.execute_cypher("COMMIT TRANSACTION")
+        await client.execute_cypher(read)
+
+    assert sent == [
+        read,
+        "BEGIN TRANSACTION",
+        "CREATE (n:N)",
+        read,
+        read,
+        "ROLLBACK TRANSACTION",
+        read,
+        "BEGIN TRANSACTION",
+        read,
+        read,
+        "COMMIT TRANSACTION",
+        read,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streamed_write_clears_query_cache():
+    """A write sent through execute_cypher_stream invalidates cached reads."""
+    pytest.importorskip("ijson")
+    import json
+
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content)["query"])
+        return httpx.Response(200, json={"columns": ["c"], "rows": [[1]]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("http://localhost:15474", http_client=http, query_cache_size=8)
+        read = "MATCH (n) RETURN count(n) AS c"
+        await client.execute_cypher(read)
+        async for _ in client.execute_cypher_stream("CREATE (n:N) RETURN 1"):
+            pass
+        await client.execute_cypher(read)
+
+    assert sent == [read, "CREATE (n:N) RETURN 1", read]
+
+
+@pytest.mark.asyncio
+async def test_switch_database_drops_cached_reads():
+    """Reads cached before switching databases are fetched again after."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        if request.method == "PUT":
+            return httpx.Response(200, json={"success": True, "message": ""})
+        if request.url.path == "/schema/labels":
+            return httpx.Response(200, json={"labels": [{"name": "A", "id": 0}]})
+        return httpx.Response(200, json={"node": {"id": 1, "labels": [], "properties": {}}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient(
+            "http://localhost:15474",
+            http_client=http,
+            read_cache_size=8,
+            enable_metadata_cache=True,
+        )
+        for _ in range(2):
+            await client.list_labels()
+            await client.get_node(1)
+            await client.get_node(1)
+            await client.switch_database("other")
+
+    reads = [("GET", "/schema/labels"), ("GET", "/data/nodes/1")]
+    switch = [("PUT", "/session/database")]
+    assert calls == (reads + switch) * 2
+
+
+@pytest.mark.asyncio
+async def test_execute_in_tx_over_rpc_without_rest_port(monkeypatch):
+    """An unreachable REST port is remembered and the RPC path is used."""
+    from nexus_sdk import client as client_module
+    from nexus_sdk.transport import TransportResponse, nx
+
+    async def no_sleep(attempt):
+        pass
+
+    monkeypatch.setattr(client_module, "_sleep_backoff", no_sleep)
+    probes = []
+    statements = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        probes.append(request.url.path)
+        raise httpx.ConnectError("refused", request=request)
+
+    async def execute(request):
+        statements.append(request.args[0].value)
+        return TransportResponse(nx.Map([(nx.Str("columns"), nx.Array([]))]))
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = NexusClient("nexus://127.0.0.1:1", http_client=http, max_retries=0)
+        client._transport.execute = execute
+        await client.execute_in_tx(["A"])
+        await client.execute_in_tx(["B"])
+
+    assert probes == ["/cypher/tx"]
+    assert statements == [
+        "BEGIN TRANSACTION",
+        "A",
+        "COMMIT TRANSACTION",
+        "BEGIN TRANSACTION",
+        "B",
+        "COMMIT TRANSACTION",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_prewarm_closes_the_client():
+    """If warm-up fails on entry the owned connections are released."""
+    client = NexusClient("http://localhost:15474", prewarm=True)
+
+    async def refuse(request):
+        raise ConnectionRefusedError("down")
+
+    async def probe(url, **kwargs):
+        return httpx.Response(200)
+
+    client._transport.execute = refuse
+    client._client.get = probe
+    with pytest.raises(ConnectionRefusedError):
+        async with client:
+            pass
+    assert client._client.is_closed
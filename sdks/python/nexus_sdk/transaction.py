@@ -1,12 +1,16 @@
 """Transaction support for Nexus SDK."""
 
-from typing import Dict, Optional
+import itertools
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
 from nexus_sdk.client import NexusClient
-from nexus_sdk.error import ValidationError
+from nexus_sdk.error import ApiError, ValidationError
 from nexus_sdk.models import QueryResult, Value
 
+# Client-side handle ids; the server assigns the real transaction id.
+_TX_COUNTER = itertools.count()
+
 
 class TransactionStatus(Enum):
     """Transaction status."""
@@ -18,17 +22,32 @@ class TransactionStatus(Enum):
 
 
 class Transaction:
-    """Transaction handle for managing database transactions."""
+    """Transaction handle for managing database transactions.
+
+    A deferred transaction sends nothing on ``begin()``. Statements added
+    with ``queue()`` are held until ``commit()``, which runs them through
+    ``NexusClient.execute_in_tx`` (one request where the server supports
+    it, rolled back if any of them fails), and ``rollback()`` just discards
+    them. ``execute()`` needs a result straight away, so it first sends
+    ``BEGIN`` and the queued statements, and the transaction continues
+    statement by statement.
+    """
 
-    def __init__(self, client: NexusClient):
+    __slots__ = ("_client", "_transaction_id", "_active", "_deferred", "_queued")
+
+    def __init__(self, client: NexusClient, deferred: bool = False):
         """Create a new transaction handle.
 
         Args:
             client: NexusClient instance
+            deferred: Hold back BEGIN and queued statements until commit
         """
         self._client = client
         self._transaction_id: Optional[str] = None
         self._active: bool = False
+        self._deferred = deferred
+        # Statements not yet sent; None once BEGIN has gone to the server.
+        self._queued: Optional[List[Tuple[str, Optional[Dict[str, Value]]]]] = None
 
     async def begin(self) -> None:
         """Begin a new transaction.
@@ -40,12 +59,13 @@ class Transaction:
         if self._active:
             raise ValidationError("Transaction already active")
 
-        await self._client.execute_cypher("BEGIN TRANSACTION", None)
-
-        import asyncio
+        if self._deferred:
+            self._queued = []
+        else:
+            await self._client._execute_control("BEGIN TRANSACTION")
 
         self._active = True
-        self._transaction_id = f"tx_{asyncio.get_event_loop().time()}"
+        self._transaction_id = f"tx_{next(_TX_COUNTER)}"
 
     async def commit(self) -> None:
         """Commit the transaction.
@@ -57,8 +77,20 @@ class Transaction:
         if not self._active:
             raise ValidationError("No active transaction to commit")
 
-        await self._client.execute_cypher("COMMIT TRANSACTION", None)
-
+        queued = self._queued
+        if queued is None:
+            await self._client._execute_control("COMMIT TRANSACTION")
+        elif queued:
+            try:
+                await self._client.execute_in_tx(queued)
+            except BaseException:
+                # execute_in_tx has already rolled back; nothing is open.
+                self._queued = None
+                self._active = False
+                self._transaction_id = None
+                raise
+
+        self._queued = None
         self._active = False
         self._transaction_id = None
 
@@ -72,8 +104,10 @@ class Transaction:
         if not self._active:
             raise ValidationError("No active transaction to rollback")
 
-        await self._client.execute_cypher("ROLLBACK TRANSACTION", None)
+        if self._queued is None:
+            await self._client._execute_control("ROLLBACK TRANSACTION")
 
+        self._queued = None
         self._active = False
         self._transaction_id = None
 
@@ -117,8 +151,50 @@ class Transaction:
         if not self._active:
             raise ValidationError("Transaction is not active")
 
+        if self._queued is not None:
+            await self._send_queued()
         return await self._client.execute_cypher(query, parameters)
 
+    async def queue(self, query: str, parameters: Optional[Dict[str, Value]] = None) -> None:
+        """Add a statement whose result is not needed.
+
+        In a deferred transaction the statement is held until commit;
+        otherwise it runs immediately like ``execute``.
+
+        Args:
+            query: Cypher query string
+            parameters: Optional query parameters
+
+        Raises:
+            ValidationError: If transaction is not active
+            ApiError: If the API returns an error
+        """
+        if not self._active:
+            raise ValidationError("Transaction is not active")
+
+        if self._queued is not None:
+            self._queued.append((query, parameters))
+        else:
+            await self._run_unread(query, parameters)
+
+    async def _send_queued(self) -> None:
+        """Send BEGIN and the held statements; later calls go out directly."""
+        queued = self._queued or []
+        self._queued = None
+        await self._client._execute_control("BEGIN TRANSACTION")
+        for query, parameters in queued:
+            await self._run_unread(query, parameters)
+
+    async def _run_unread(self, query: str, parameters: Optional[Dict[str, Value]]) -> None:
+        """Run a statement whose result nobody reads, raising its error.
+
+        The server reports Cypher errors in the result rather than as a
+        failed request, and no caller would ever see them otherwise.
+        """
+        result = await self._client.execute_cypher(query, parameters, cache=False)
+        if result.error:
+            raise ApiError(result.error, 0)
+
     @property
     def transaction_id(self) -> Optional[str]:
         """Get the transaction ID.
@@ -23,7 +23,7 @@ from typing import Any, Tuple, Union
 
 import msgpack  # type: ignore[import-untyped]
 
-from nexus_sdk.transport.types import NexusValue, nx
+from nexus_sdk.transport.types import NexusValue, _with_slots, nx
 
 # rmp-serde encodes Rust's `Result<Ok, Err>` as `{"Ok": v}` / `{"Err": s}`.
 _OK_TAG = "Ok"
@@ -117,6 +117,7 @@ def from_wire_value(raw: Any) -> NexusValue:
     raise ValueError(f"decode: unknown NexusValue tag '{tag}'")
 
 
+@_with_slots
 @dataclass
 class RpcRequest:
     id: int
@@ -124,6 +125,7 @@ class RpcRequest:
     args: list
 
 
+@_with_slots
 @dataclass
 class RpcResponse:
     id: int
@@ -9,6 +9,8 @@ import os
 from dataclasses import dataclass
 from typing import Optional
 
+import httpx
+
 from nexus_sdk.transport.endpoint import (
     Endpoint,
     HTTP_DEFAULT_PORT,
@@ -43,12 +45,15 @@ def build_transport(
     resp3_port: Optional[int] = None,
     timeout_s: float = 30.0,
     env_transport: Optional[str] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
 ) -> BuiltTransport:
     """Resolve the effective transport given the precedence chain.
 
     ``env_transport`` is injected so the tests can exercise the env-var
     path without mutating ``os.environ``. Defaults to
-    ``NEXUS_SDK_TRANSPORT``.
+    ``NEXUS_SDK_TRANSPORT``. ``http_client`` is handed to the HTTP
+    transport so several clients can share one connection pool; the RPC
+    transport ignores it.
     """
     endpoint = parse_endpoint(base_url) if base_url else default_local_endpoint()
 
@@ -80,7 +85,9 @@ def build_transport(
         )
     if mode in (TransportMode.HTTP, TransportMode.HTTPS):
         return BuiltTransport(
-            transport=HttpTransport(endpoint, credentials, timeout_s=timeout_s),
+            transport=HttpTransport(
+                endpoint, credentials, timeout_s=timeout_s, client=http_client
+            ),
             endpoint=endpoint,
             mode=mode,
         )
@@ -13,6 +13,7 @@ from typing import List, Optional
 
 import httpx
 
+from nexus_sdk._json import dumps, error_message, loads
 from nexus_sdk.transport.command_map import json_to_nexus
 from nexus_sdk.transport.endpoint import Endpoint
 from nexus_sdk.transport.types import (
@@ -32,13 +33,25 @@ class HttpTransport(Transport):
         endpoint: Endpoint,
         credentials: TransportCredentials,
         timeout_s: float = 30.0,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         self._endpoint = endpoint
         self._credentials = credentials
         self._base_url = endpoint.as_http_url()
-        self._client = httpx.AsyncClient(
+        # A caller-supplied client is shared with other transports, so
+        # only close the one we created ourselves.
+        self._owns_client = client is None
+        # Auth headers are built once: sent as defaults on our own client,
+        # per request on a shared one.
+        auth_headers = self._auth_headers()
+        self._request_headers = {} if self._owns_client else auth_headers
+        self._json_headers = {
+            **self._request_headers,
+            "Content-Type": "application/json",
+        }
+        self._client = client or httpx.AsyncClient(
             timeout=httpx.Timeout(timeout_s),
-            headers={"User-Agent": "nexus-sdk/2.5.0"},
+            headers={"User-Agent": "nexus-sdk/2.5.0", **auth_headers},
         )
 
     async def execute(self, req: TransportRequest) -> TransportResponse:
@@ -53,7 +66,8 @@ class HttpTransport(Transport):
         return False
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     # ── Internals ──────────────────────────────────────────────────────
 
@@ -71,13 +85,15 @@ class HttpTransport(Transport):
 
     async def _dispatch(self, cmd: str, args: List[NexusValue]) -> NexusValue:
         url_base = self._base_url
-        headers = self._auth_headers()
+        headers = self._request_headers
         if cmd == "CYPHER":
             query = _as_str(args, 0, "CYPHER")
             params = _nexus_to_plain(args[1]) if len(args) > 1 else None
-            body = {"query": query, "parameters": params}
+            # Bodies go through the shared encoder (orjson when installed)
+            # rather than httpx's json=, which always uses the stdlib.
+            body = dumps({"query": query, "parameters": params})
             resp = await self._client.post(
-                f"{url_base}/cypher", json=body, headers=headers
+                f"{url_base}/cypher", content=body, headers=self._json_headers
             )
             return _http_json(resp)
         if cmd in ("PING", "HEALTH"):
@@ -92,7 +108,9 @@ class HttpTransport(Transport):
         if cmd == "DB_CREATE":
             name = _as_str(args, 0, "DB_CREATE")
             resp = await self._client.post(
-                f"{url_base}/databases", json={"name": name}, headers=headers
+                f"{url_base}/databases",
+                content=dumps({"name": name}),
+                headers=self._json_headers,
             )
             return _http_json(resp)
         if cmd == "DB_DROP":
@@ -104,7 +122,9 @@ class HttpTransport(Transport):
         if cmd == "DB_USE":
             name = _as_str(args, 0, "DB_USE")
             resp = await self._client.put(
-                f"{url_base}/session/database", json={"name": name}, headers=headers
+                f"{url_base}/session/database",
+                content=dumps({"name": name}),
+                headers=self._json_headers,
             )
             return _http_json(resp)
         if cmd == "DB_CURRENT":
@@ -172,14 +192,12 @@ def _nexus_to_plain(v: NexusValue) -> object:
 
 def _http_json(resp: httpx.Response) -> NexusValue:
     if resp.status_code >= 400:
-        try:
-            text = resp.text
-        except Exception:
-            text = f"HTTP {resp.status_code}"
-        raise RuntimeError(f"HTTP {resp.status_code}: {text}")
+        raise RuntimeError(
+            f"HTTP {resp.status_code}: {error_message(resp.content)}"
+        )
     try:
-        data = resp.json()
-    except Exception:
+        data = loads(resp.content)
+    except ValueError:
         data = resp.text
     return json_to_nexus(data)
 
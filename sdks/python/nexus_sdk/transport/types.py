@@ -9,9 +9,40 @@ interface.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, List, Optional, Tuple, Type, TypeVar, Union
+
+_T = TypeVar("_T")
+
+
+def _with_slots(cls: Type[_T]) -> Type[_T]:
+    """Rebuild a dataclass with ``__slots__`` (``slots=True`` needs 3.10).
+
+    Used on the value types created per request/response or per result
+    cell, where a per-instance ``__dict__`` costs more than the data.
+    Field defaults already live in the generated ``__init__``, so the
+    class attributes holding them can be dropped.
+    """
+    names = tuple(f.name for f in fields(cls))  # type: ignore[arg-type]
+    body = {k: v for k, v in cls.__dict__.items() if k not in names}
+    body.pop("__dict__", None)
+    body.pop("__weakref__", None)
+    body["__slots__"] = names
+    if cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+        # Default pickling restores slots with setattr, which frozen blocks.
+        def __getstate__(self: Any) -> Tuple[Any, ...]:
+            return tuple(getattr(self, n) for n in names)
+
+        def __setstate__(self: Any, state: Tuple[Any, ...]) -> None:
+            for n, v in zip(names, state):
+                object.__setattr__(self, n, v)
+
+        body["__getstate__"] = __getstate__
+        body["__setstate__"] = __setstate__
+    slotted = type(cls)(cls.__name__, cls.__bases__, body)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
 
 
 class TransportMode(str, Enum):
@@ -57,6 +88,7 @@ class TransportMode(str, Enum):
 # the externally-tagged MessagePack format rmp-serde uses on the wire.
 
 
+@_with_slots
 @dataclass(frozen=True)
 class NexusValue:
     """Dynamically-typed value carried by RPC requests and responses."""
@@ -125,6 +157,7 @@ class TransportCredentials:
         return bool(self.api_key) or (bool(self.username) and bool(self.password))
 
 
+@_with_slots
 @dataclass
 class TransportRequest:
     """A single request against the active transport."""
@@ -133,6 +166,7 @@ class TransportRequest:
     args: List[NexusValue] = field(default_factory=list)
 
 
+@_with_slots
 @dataclass
 class TransportResponse:
     """A single response from the active transport."""
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import json
+import pickle
 import struct
 
+import httpx
 import msgpack  # type: ignore[import-untyped]
 import pytest
 
@@ -28,8 +31,14 @@ from nexus_sdk.transport.endpoint import (
     parse_endpoint,
 )
 from nexus_sdk.transport.factory import build_transport
+from nexus_sdk.transport.http_transport import HttpTransport
 from nexus_sdk.transport.rpc import RpcTransport
-from nexus_sdk.transport.types import TransportCredentials, TransportMode, nx
+from nexus_sdk.transport.types import (
+    TransportCredentials,
+    TransportMode,
+    TransportRequest,
+    nx,
+)
 
 # ── Endpoint parser ────────────────────────────────────────────────────
 
@@ -135,6 +144,13 @@ class TestWireValue:
         with pytest.raises(ValueError, match="unknown NexusValue tag"):
             from_wire_value({"Widget": "x"})
 
+    def test_values_are_slotted_and_still_frozen(self) -> None:
+        value = nx.Str("hi")
+        assert not hasattr(value, "__dict__")
+        with pytest.raises(AttributeError):
+            value.kind = "Int"  # type: ignore[misc]
+        assert pickle.loads(pickle.dumps(value)) == value
+
 
 class TestFrameCodec:
     def test_frame_has_u32_le_length_prefix(self) -> None:
@@ -323,3 +339,42 @@ class TestCredentials:
 
     def test_user_and_pass_together_count(self) -> None:
         assert TransportCredentials(username="u", password="p").has_any()
+
+
+# ── HttpTransport response decoding ───────────────────────────────────
+
+
+def _mock_http_transport(handler) -> HttpTransport:
+    ep = Endpoint(scheme="http", host="localhost", port=HTTP_DEFAULT_PORT)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return HttpTransport(ep, TransportCredentials(), client=client)
+
+
+class TestHttpTransportDecoding:
+    @pytest.mark.asyncio
+    async def test_json_body_decoded(self) -> None:
+        t = _mock_http_transport(
+            lambda req: httpx.Response(200, json={"columns": ["n"], "rows": [[1]]})
+        )
+        resp = await t.execute(TransportRequest(command="CYPHER", args=[nx.Str("RETURN 1")]))
+        assert nexus_to_json(resp.value) == {"columns": ["n"], "rows": [[1]]}
+
+    @pytest.mark.asyncio
+    async def test_non_json_body_falls_back_to_text(self) -> None:
+        t = _mock_http_transport(lambda req: httpx.Response(200, text="OK"))
+        resp = await t.execute(TransportRequest(command="HEALTH"))
+        assert nexus_to_json(resp.value) == "OK"
+
+    @pytest.mark.asyncio
+    async def test_cypher_body_is_pre_encoded_json(self) -> None:
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append((request.headers["Content-Type"], request.content))
+            return httpx.Response(200, json={"columns": [], "rows": []})
+
+        t = _mock_http_transport(handler)
+        await t.execute(TransportRequest(command="CYPHER", args=[nx.Str("RETURN $x"), nx.Map([])]))
+        content_type, body = seen[0]
+        assert content_type == "application/json"
+        assert json.loads(body) == {"query": "RETURN $x", "parameters": {}}